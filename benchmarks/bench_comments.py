@@ -0,0 +1,75 @@
+"""
+Benchmark parsing of comment-heavy theories.
+
+It times the installed build only, so it guards against regressions. The
+EOF-correct comment scanner parses these theories as fast as the previous one
+did, within run-to-run noise: its ASCII whitespace and star-run fast paths give
+no measurable speedup.
+
+Usage: python benchmarks/bench_comments.py [--rules N] [--repeat N]
+"""
+
+import argparse
+import time
+
+import tree_sitter_spthy as ts_spthy
+from tree_sitter import Parser
+
+DOC_BLOCK = """/*
+ * Rule {i}: the initiator sends a fresh nonce encrypted for the responder.
+ * Nested /* comments */ and stray ** stars * / slashes are part of the text.
+ * ∀ ∃ ⇒ ⊕ — long documentation blocks are common in case studies.
+ */
+"""
+
+COMMENTED_PROOF = """// lemma Old_{i}:
+//   "All x #i. Secret(x) @ #i ==> not (Ex #j. K(x) @ #j)"
+// simplify
+// solve( Init_{i}( ~n ) ▶₀ #i )
+//   case Init
+//   by contradiction /* from formulas */
+"""
+
+RULE = """rule Init_{i}:
+    [ Fr(~n), !Pk($B, pkB) ]   // fresh nonce
+  --[ Secret(~n) ]->           /* action */
+    [ Out(aenc{{~n}}pkB) ]     // send
+
+text{i}{{* Formal comment for rule {i} with * stars and a brace }} inside *}}
+"""
+
+
+def make_theory(rules: int) -> bytes:
+    parts = ["theory Comments begin\n\nfunctions: aenc/2\n\n"]
+    for i in range(rules):
+        parts.append(DOC_BLOCK.format(i=i))
+        parts.append(COMMENTED_PROOF.format(i=i))
+        parts.append(RULE.format(i=i))
+    parts.append("end\n")
+    return "".join(parts).encode("utf-8")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--rules", type=int, default=2000)
+    arg_parser.add_argument("--repeat", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    source = make_theory(args.rules)
+    parser = Parser(ts_spthy.language())
+    tree = parser.parse(source)
+    assert not tree.root_node.has_error, "benchmark theory does not parse"
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        parser.parse(source)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    print(f"{len(source) / 1e6:.2f} MB, {args.rules} rules")
+    print(f"best {best * 1e3:.1f} ms, {len(source) / best / 1e6:.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark validation with a growing number of checks.
+
+Every row runs the first N default checks once in one shared walk and once
+as N separate single-check walks. The shared walk pays for walking the tree
+once, and each check only adds the cost of its own handlers. Separate walks
+pay for the walk again for every check.
+
+Usage: python benchmarks/bench_validation.py [--rules N] [--repeat N]
+"""
+
+import argparse
+import gc
+import time
+
+import tree_sitter_spthy as ts_spthy
+from tree_sitter import Parser
+
+from py_tree_sitter_spthy.validation import DEFAULT_CHECKS, Validator
+
+HEADER = """theory Validation begin
+
+builtins: asymmetric-encryption, hashing
+
+functions: mac/2, kdf/1
+
+"""
+
+RULES = """rule Register_{i}:
+    [ Fr(~ltk) ]
+  --[ Register_{i}($A, pk(~ltk)) ]->
+    [ !Ltk_{i}($A, ~ltk), !Pk_{i}($A, pk(~ltk)), Out(pk(~ltk)) ]
+
+rule Init_{i}:
+    [ Fr(~n), !Pk_{i}($B, pkB) ]
+  --[ Send_{i}($B, ~n), Secret_{i}(~n) ]->
+    [ Out(aenc(<~n, mac(~n, h(~n))>, pkB)), St_{i}($B, ~n) ]
+
+rule Resp_{i}:
+    [ !Ltk_{i}($B, ~ltk), In(aenc(<n, t>, pk(~ltk))) ]
+  --[ Recv_{i}($B, n), Eq_{i}(t, mac(n, h(n))) ]->
+    [ Out(kdf(n)) ]
+
+restriction Equal_{i}:
+    "All x y #i. Eq_{i}(x, y) @ #i ==> x = y"
+
+lemma Secrecy_{i}:
+    "All n #i. Secret_{i}(n) @ #i ==> not (Ex #j. K(n) @ #j)"
+
+lemma Executable_{i}:
+    exists-trace "Ex B n #i #j. Send_{i}(B, n) @ #i & Recv_{i}(B, n) @ #j"
+
+"""
+
+
+def make_theory(rules: int) -> bytes:
+    parts = [HEADER]
+    for i in range(rules):
+        parts.append(RULES.format(i=i))
+    parts.append("end\n")
+    return "".join(parts).encode("utf-8")
+
+
+def best_of(repeat: int, run) -> float:
+    timings = []
+    # Like timeit, keep collections of earlier runs out of the timings
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return min(timings)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--rules", type=int, default=1000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    source = make_theory(args.rules)
+    tree = Parser(ts_spthy.language()).parse(source)
+    assert not tree.root_node.has_error, "benchmark theory does not parse"
+    assert Validator().validate(tree) == [], "benchmark theory has findings"
+
+    print(f"{len(source) / 1e6:.2f} MB, {args.rules * 3} rules")
+    print("checks   shared walk   separate walks")
+    for count in range(len(DEFAULT_CHECKS) + 1):
+        checks = DEFAULT_CHECKS[:count]
+        shared = Validator(checks)
+        separate = [Validator([check]) for check in checks] or [Validator([])]
+
+        shared_time = best_of(args.repeat, lambda: shared.validate(tree))
+        separate_time = best_of(
+            args.repeat, lambda: [validator.validate(tree) for validator in separate]
+        )
+        print(
+            f"{count:6}   {shared_time * 1e3:8.1f} ms   {separate_time * 1e3:9.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
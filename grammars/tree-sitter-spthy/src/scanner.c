@@ -16,66 +16,88 @@ void tree_sitter_spthy_external_scanner_destroy(void *payload) {}
 unsigned tree_sitter_spthy_external_scanner_serialize(void *payload, char *buffer) {return 0;}
 void tree_sitter_spthy_external_scanner_deserialize(void *payload, const char *buffer, unsigned length) {}
 
-bool tree_sitter_spthy_external_scanner_scan(void *payload, TSLexer *lexer, const bool *valid_symbols) {
-    while (iswspace(lexer->lookahead)) lexer->advance(lexer, true);
+static inline void advance(TSLexer *lexer) { lexer->advance(lexer, false); }
 
-    if (lexer->lookahead == '/') {
-        lexer->advance(lexer, false);
-        if (lexer->lookahead == '*') {
-            lexer->advance(lexer, false);
+static inline void skip(TSLexer *lexer) { lexer->advance(lexer, true); }
+
+// The lexer reports a lookahead of 0 at the end of the input, but a NUL byte
+// in the text looks the same. Only ask the lexer when it matters.
+static inline bool at_eof(const TSLexer *lexer) {
+    return lexer->lookahead == 0 && lexer->eof(lexer);
+}
+
+static inline bool is_space(int32_t c) {
+    switch (c) {
+    case ' ':
+    case '\t':
+    case '\n':
+    case '\r':
+    case '\f':
+    case '\v':
+        return true;
+    default:
+        return c >= 0x80 && iswspace(c);
+    }
+}
 
-            bool after_star = false;
-            unsigned nesting_depth = 1;
-            for (;;) {
-                switch (lexer->lookahead) {
-                case '\0':
-                    return false;
-                case '*':
-                    lexer->advance(lexer, false);
-                    after_star = true;
-                    break;
-                case '/':
-                    if (after_star) {
-                        lexer->advance(lexer, false);
-                        after_star = false;
-                        nesting_depth--;
-                        if (nesting_depth == 0) {
-                            lexer->result_symbol = MULTI_COMMENT;
-                            return true;
-                        }
-                    } else {
-                        lexer->advance(lexer, false);
-                        after_star = false;
-                        if (lexer->lookahead == '*') {
-                            nesting_depth++;
-                            lexer->advance(lexer, false);
-                        }
-                    }
-                    break;
-                default:
-                    lexer->advance(lexer, false);
-                    after_star = false;
-                    break;
+// Scans the rest of a nested /* */ comment, the opening "/*" is consumed.
+static bool scan_multi_comment(TSLexer *lexer) {
+    unsigned nesting_depth = 1;
+    for (;;) {
+        switch (lexer->lookahead) {
+        case '*':
+            do {
+                advance(lexer);
+            } while (lexer->lookahead == '*');
+            if (lexer->lookahead == '/') {
+                advance(lexer);
+                if (--nesting_depth == 0) {
+                    lexer->result_symbol = MULTI_COMMENT;
+                    return true;
                 }
             }
-        } else if (lexer->lookahead == '/') {
-           lexer->advance(lexer, false);
-
-           for (;;) {
-               switch (lexer->lookahead) {
-               case '\n':
-                   lexer->result_symbol = SINGLE_COMMENT;
-                   return true;
-               case '\0':
-                   lexer->result_symbol = SINGLE_COMMENT;
-                   return true;
-               default:
-                   lexer->advance(lexer, false);
-                   break;
-               }
-           }
+            break;
+        case '/':
+            advance(lexer);
+            if (lexer->lookahead == '*') {
+                advance(lexer);
+                nesting_depth++;
+            }
+            break;
+        case 0:
+            // Unterminated comment
+            if (lexer->eof(lexer)) return false;
+            advance(lexer);
+            break;
+        default:
+            advance(lexer);
+            break;
         }
     }
+}
 
+// Scans the rest of a // comment, the opening "//" is consumed.
+static bool scan_single_comment(TSLexer *lexer) {
+    while (lexer->lookahead != '\n' && !at_eof(lexer)) {
+        advance(lexer);
+    }
+    lexer->result_symbol = SINGLE_COMMENT;
+    return true;
+}
+
+bool tree_sitter_spthy_external_scanner_scan(void *payload, TSLexer *lexer, const bool *valid_symbols) {
+    while (is_space(lexer->lookahead)) skip(lexer);
+
+    if (lexer->lookahead != '/') return false;
+    advance(lexer);
+
+    if (lexer->lookahead == '*') {
+        advance(lexer);
+        return scan_multi_comment(lexer);
+    }
+    if (lexer->lookahead == '/') {
+        advance(lexer);
+        return scan_single_comment(lexer);
+    }
     return false;
 }
@@ -1,5 +1,9 @@
 """Tree-sitter parser for Spthy language."""
 
+from .positions import PositionIndex
+from .terms import Term, TermDAG, extract_term_dag
+from .validation import Check, Finding, Validator, validate
+
 try:
     from tree_sitter_spthy import language
 
@@ -7,7 +11,27 @@ try:
         """Get the tree-sitter language for Spthy."""
         return language()
 
-    __all__ = ["get_language", "language"]
+    __all__ = [
+        "get_language",
+        "language",
+        "PositionIndex",
+        "Term",
+        "TermDAG",
+        "extract_term_dag",
+        "Check",
+        "Finding",
+        "Validator",
+        "validate",
+    ]
 except ImportError:
     # Fallback during build
-    __all__ = []
+    __all__ = [
+        "PositionIndex",
+        "Term",
+        "TermDAG",
+        "extract_term_dag",
+        "Check",
+        "Finding",
+        "Validator",
+        "validate",
+    ]
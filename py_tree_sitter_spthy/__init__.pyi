@@ -1,9 +1,29 @@
 from typing import TYPE_CHECKING
 
+from .positions import PositionIndex as PositionIndex
+from .terms import Term as Term
+from .terms import TermDAG as TermDAG
+from .terms import extract_term_dag as extract_term_dag
+from .validation import Check as Check
+from .validation import Finding as Finding
+from .validation import Validator as Validator
+from .validation import validate as validate
+
 if TYPE_CHECKING:
     from tree_sitter import Language
 
 def get_language() -> "Language": ...
 def language() -> "Language": ...
 
-__all__ = ["get_language", "language"]
+__all__ = [
+    "get_language",
+    "language",
+    "PositionIndex",
+    "Term",
+    "TermDAG",
+    "extract_term_dag",
+    "Check",
+    "Finding",
+    "Validator",
+    "validate",
+]
@@ -0,0 +1,4369 @@
+# Generated by scripts/generate_node_types.py, do not edit.
+"""Kind ids, field ids and typed node wrappers of the Spthy grammar."""
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Type
+
+if TYPE_CHECKING:
+    from tree_sitter import Node
+
+LANGUAGE_VERSION = 14
+SYMBOL_COUNT = 433
+ALIAS_COUNT = 2
+FIELD_COUNT = 38
+
+# Kind ids of named nodes, as returned by Node.kind_id
+IDENT = 1
+STANDARD_PROOF_METHOD_RANKING = 64
+NULL = 95
+SOLVED = 149
+MIRRORED = 150
+PARAM = 208
+EXPORT_QUERY = 209
+NATURAL = 210
+MULTI_COMMENT = 222
+SINGLE_COMMENT = 223
+THEORY = 224
+COMMANDLINE = 225
+PREPROCESSOR = 228
+IFDEF = 229
+DEFINE = 230
+INCLUDE = 231
+IFDEF_NESTED = 233
+IFDEF_OR = 234
+IFDEF_AND = 235
+IFDEF_NOT = 236
+BUILT_INS = 238
+BUILT_IN = 239
+FUNCTIONS = 240
+FUNCTION_UNTYPED = 242
+FUNCTION_ATTRIBUTE = 243
+FUNCTION_TYPED = 244
+EQUATIONS = 245
+EQUATION = 246
+PREDICATES = 247
+PREDICATE = 248
+OPTIONS = 250
+OPTION = 251
+GLOBAL_HEURISTIC = 252
+ORACLE_PROOF_METHOD_RANKING = 254
+TACTIC_PROOF_METHOD_RANKING = 255
+TACTIC = 256
+PRESORT = 257
+PRIO = 258
+DEPRIO = 259
+POST_RANKING = 260
+OR_FUNCTION = 262
+AND_FUNCTION = 263
+NOT_FUNCTION = 264
+STD_FUNCTION = 265
+FUNCTION_NAME = 266
+PROCESS = 267
+LOCATION_PROCESS = 272
+INLINE_MSR_PROCESS = 273
+PREDEFINED_PROCESS = 275
+BINDING = 276
+OUTPUT = 277
+INPUT = 278
+CONDITIONAL = 279
+PROCESS_LET = 280
+DETERMINISTIC_CHOICE = 281
+NON_DETERMINISTIC_CHOICE = 282
+EVENT = 283
+REPLICATION = 284
+SET_STATE = 285
+DELETE_STATE = 286
+READ_STATE = 287
+SET_LOCK = 288
+REMOVE_LOCK = 289
+EQUALITY_CHECK = 291
+LESSER_CHECK = 292
+LET = 293
+EXPORT = 294
+RULE = 296
+DIFF_RULE = 297
+SIMPLE_RULE = 298
+PREMISE = 299
+ACTION_FACT = 300
+CONCLUSION = 301
+VARIANTS = 302
+MODULO = 303
+RULE_ATTRS = 304
+RULE_ATTR = 305
+RULE_ATTR_COLOR = 306
+RULE_ROLE = 307
+RULE_PROCESS = 308
+RULE_LET_BLOCK = 309
+RULE_LET_TERM = 310
+MACROS = 311
+MACRO = 312
+EMBEDDED_RESTRICTION = 313
+LINEAR_FACT = 317
+FACT_ANNOTES = 318
+FACT_ANNOTE = 319
+RESTRICTION = 320
+RESTRICTION_ATTR = 321
+CASE_TEST = 322
+LEMMA = 324
+LEMMA_ATTR = 325
+LANGUAGE = 326
+DIFF_LEMMA = 327
+DIFF_LEMMA_ATTRS = 328
+DIFF_LEMMA_ATTR = 329
+ACCOUNTABILITY_LEMMA = 330
+EQUIV_LEMMA = 331
+DIFF_EQUIV_LEMMA = 332
+TRACE_QUANTIFIER = 333
+BY_METHOD = 335
+METHOD_SKELETON = 336
+CASES = 337
+CASE = 338
+PROOF_METHOD = 340
+STEP = 341
+CONSTRAINT = 342
+PREMISE_CONSTRAINT = 343
+ACTION_CONSTRAINT = 344
+CHAIN_CONSTRAINT = 345
+DISJUNCTION_SPLIT_CONSTRAINT = 346
+EQ_SPLIT_CONSTRAINT = 347
+TUPLE_TERM = 349
+MSET_TERM = 350
+NAT_TERM = 351
+XOR_TERM = 352
+MUL_TERM = 353
+EXP_TERM = 354
+NESTED_TERM = 355
+NULLARY_FUN = 356
+BINARY_APP = 357
+NARY_APP = 358
+ARGUMENTS = 359
+PUB_VAR = 362
+FRESH_VAR = 363
+MSG_VAR_OR_NULLARY_FUN = 364
+TEMPORAL_VAR = 365
+NAT_VAR = 366
+COMP_VAR = 367
+CUSTOM_VAR = 369
+ANY_VAR = 370
+PUB_NAME = 372
+FRESH_NAME = 373
+IFF = 375
+IMP = 376
+DISJUNCTION = 377
+CONJUNCTION = 378
+NEGATION = 379
+NESTED_FORMULA = 380
+TEMP_VAR_INDUCTION = 382
+TEMP_VAR_ORDER = 383
+TEMP_VAR_EQ = 384
+TERM_EQ = 385
+SUBTERM_REL = 386
+QUANTIFIED_FORMULA = 387
+ATOM = 388
+PREDICATE_REF = 390
+PRE_DEFINED = 391
+HEXCOLOR = 392
+NATURAL_SUBSCRIPT = 393
+FORMAL_COMMENT = 394
+PATH = 433
+PERSISTENT_FACT = 434
+
+# Field ids, as accepted by Node.child_by_field_id
+FIELD_ARGUMENT = 1
+FIELD_ARITY = 2
+FIELD_BASE = 3
+FIELD_CASE_IDENTIFIER = 4
+FIELD_COMMENT_IDENTIFIER = 5
+FIELD_CONDITION = 6
+FIELD_ELSE = 7
+FIELD_EXPONENT = 8
+FIELD_EXPORT_IDENTIFIER = 9
+FIELD_FACT = 10
+FIELD_FACT_IDENTIFIER = 11
+FIELD_FIRST = 12
+FIELD_FORMULA = 13
+FIELD_FROM = 14
+FIELD_FUNCTION_IDENTIFIER = 15
+FIELD_FUNCTION_TYPE = 16
+FIELD_IN = 17
+FIELD_LEFT = 18
+FIELD_LEMMA_IDENTIFIER = 19
+FIELD_LET_IDENTIFIER = 20
+FIELD_LOCATION_IDENTIFIER = 21
+FIELD_MACRO_IDENTIFIER = 22
+FIELD_PREDICATE_IDENTIFIER = 23
+FIELD_PROOF_METHOD_RANKING = 24
+FIELD_PROOF_SKELETON = 25
+FIELD_RESTRICTION_IDENTIFIER = 26
+FIELD_RIGHT = 27
+FIELD_ROLE_IDENTIFIER = 28
+FIELD_RULE_IDENTIFIER = 29
+FIELD_SECOND = 30
+FIELD_TERM = 31
+FIELD_TEST_IDENTIFIER = 32
+FIELD_THEN = 33
+FIELD_THEORY_NAME = 34
+FIELD_TO = 35
+FIELD_VARIABLE = 36
+FIELD_VARIABLE_IDENTIFIER = 37
+FIELD_VARIABLE_TYPE = 38
+
+KIND_NAMES: Dict[int, str] = {
+    IDENT: "ident",
+    STANDARD_PROOF_METHOD_RANKING: "standard_proof_method_ranking",
+    NULL: "null",
+    SOLVED: "solved",
+    MIRRORED: "mirrored",
+    PARAM: "param",
+    EXPORT_QUERY: "export_query",
+    NATURAL: "natural",
+    MULTI_COMMENT: "multi_comment",
+    SINGLE_COMMENT: "single_comment",
+    THEORY: "theory",
+    COMMANDLINE: "commandline",
+    PREPROCESSOR: "preprocessor",
+    IFDEF: "ifdef",
+    DEFINE: "define",
+    INCLUDE: "include",
+    IFDEF_NESTED: "ifdef_nested",
+    IFDEF_OR: "ifdef_or",
+    IFDEF_AND: "ifdef_and",
+    IFDEF_NOT: "ifdef_not",
+    BUILT_INS: "built_ins",
+    BUILT_IN: "built_in",
+    FUNCTIONS: "functions",
+    FUNCTION_UNTYPED: "function_untyped",
+    FUNCTION_ATTRIBUTE: "function_attribute",
+    FUNCTION_TYPED: "function_typed",
+    EQUATIONS: "equations",
+    EQUATION: "equation",
+    PREDICATES: "predicates",
+    PREDICATE: "predicate",
+    OPTIONS: "options",
+    OPTION: "option",
+    GLOBAL_HEURISTIC: "global_heuristic",
+    ORACLE_PROOF_METHOD_RANKING: "oracle_proof_method_ranking",
+    TACTIC_PROOF_METHOD_RANKING: "tactic_proof_method_ranking",
+    TACTIC: "tactic",
+    PRESORT: "presort",
+    PRIO: "prio",
+    DEPRIO: "deprio",
+    POST_RANKING: "post_ranking",
+    OR_FUNCTION: "or_function",
+    AND_FUNCTION: "and_function",
+    NOT_FUNCTION: "not_function",
+    STD_FUNCTION: "std_function",
+    FUNCTION_NAME: "function_name",
+    PROCESS: "process",
+    LOCATION_PROCESS: "location_process",
+    INLINE_MSR_PROCESS: "inline_msr_process",
+    PREDEFINED_PROCESS: "predefined_process",
+    BINDING: "binding",
+    OUTPUT: "output",
+    INPUT: "input",
+    CONDITIONAL: "conditional",
+    PROCESS_LET: "process_let",
+    DETERMINISTIC_CHOICE: "deterministic_choice",
+    NON_DETERMINISTIC_CHOICE: "non_deterministic_choice",
+    EVENT: "event",
+    REPLICATION: "replication",
+    SET_STATE: "set_state",
+    DELETE_STATE: "delete_state",
+    READ_STATE: "read_state",
+    SET_LOCK: "set_lock",
+    REMOVE_LOCK: "remove_lock",
+    EQUALITY_CHECK: "equality_check",
+    LESSER_CHECK: "lesser_check",
+    LET: "let",
+    EXPORT: "export",
+    RULE: "rule",
+    DIFF_RULE: "diff_rule",
+    SIMPLE_RULE: "simple_rule",
+    PREMISE: "premise",
+    ACTION_FACT: "action_fact",
+    CONCLUSION: "conclusion",
+    VARIANTS: "variants",
+    MODULO: "modulo",
+    RULE_ATTRS: "rule_attrs",
+    RULE_ATTR: "rule_attr",
+    RULE_ATTR_COLOR: "rule_attr_color",
+    RULE_ROLE: "rule_role",
+    RULE_PROCESS: "rule_process",
+    RULE_LET_BLOCK: "rule_let_block",
+    RULE_LET_TERM: "rule_let_term",
+    MACROS: "macros",
+    MACRO: "macro",
+    EMBEDDED_RESTRICTION: "embedded_restriction",
+    LINEAR_FACT: "linear_fact",
+    FACT_ANNOTES: "fact_annotes",
+    FACT_ANNOTE: "fact_annote",
+    RESTRICTION: "restriction",
+    RESTRICTION_ATTR: "restriction_attr",
+    CASE_TEST: "case_test",
+    LEMMA: "lemma",
+    LEMMA_ATTR: "lemma_attr",
+    LANGUAGE: "language",
+    DIFF_LEMMA: "diff_lemma",
+    DIFF_LEMMA_ATTRS: "diff_lemma_attrs",
+    DIFF_LEMMA_ATTR: "diff_lemma_attr",
+    ACCOUNTABILITY_LEMMA: "accountability_lemma",
+    EQUIV_LEMMA: "equiv_lemma",
+    DIFF_EQUIV_LEMMA: "diff_equiv_lemma",
+    TRACE_QUANTIFIER: "trace_quantifier",
+    BY_METHOD: "by_method",
+    METHOD_SKELETON: "method_skeleton",
+    CASES: "cases",
+    CASE: "case",
+    PROOF_METHOD: "proof_method",
+    STEP: "step",
+    CONSTRAINT: "constraint",
+    PREMISE_CONSTRAINT: "premise_constraint",
+    ACTION_CONSTRAINT: "action_constraint",
+    CHAIN_CONSTRAINT: "chain_constraint",
+    DISJUNCTION_SPLIT_CONSTRAINT: "disjunction_split_constraint",
+    EQ_SPLIT_CONSTRAINT: "eq_split_constraint",
+    TUPLE_TERM: "tuple_term",
+    MSET_TERM: "mset_term",
+    NAT_TERM: "nat_term",
+    XOR_TERM: "xor_term",
+    MUL_TERM: "mul_term",
+    EXP_TERM: "exp_term",
+    NESTED_TERM: "nested_term",
+    NULLARY_FUN: "nullary_fun",
+    BINARY_APP: "binary_app",
+    NARY_APP: "nary_app",
+    ARGUMENTS: "arguments",
+    PUB_VAR: "pub_var",
+    FRESH_VAR: "fresh_var",
+    MSG_VAR_OR_NULLARY_FUN: "msg_var_or_nullary_fun",
+    TEMPORAL_VAR: "temporal_var",
+    NAT_VAR: "nat_var",
+    COMP_VAR: "comp_var",
+    CUSTOM_VAR: "custom_var",
+    ANY_VAR: "any_var",
+    PUB_NAME: "pub_name",
+    FRESH_NAME: "fresh_name",
+    IFF: "iff",
+    IMP: "imp",
+    DISJUNCTION: "disjunction",
+    CONJUNCTION: "conjunction",
+    NEGATION: "negation",
+    NESTED_FORMULA: "nested_formula",
+    TEMP_VAR_INDUCTION: "temp_var_induction",
+    TEMP_VAR_ORDER: "temp_var_order",
+    TEMP_VAR_EQ: "temp_var_eq",
+    TERM_EQ: "term_eq",
+    SUBTERM_REL: "subterm_rel",
+    QUANTIFIED_FORMULA: "quantified_formula",
+    ATOM: "atom",
+    PREDICATE_REF: "predicate_ref",
+    PRE_DEFINED: "pre_defined",
+    HEXCOLOR: "hexcolor",
+    NATURAL_SUBSCRIPT: "natural_subscript",
+    FORMAL_COMMENT: "formal_comment",
+    PATH: "path",
+    PERSISTENT_FACT: "persistent_fact",
+}
+
+FIELD_NAMES: Dict[int, str] = {
+    FIELD_ARGUMENT: "argument",
+    FIELD_ARITY: "arity",
+    FIELD_BASE: "base",
+    FIELD_CASE_IDENTIFIER: "case_identifier",
+    FIELD_COMMENT_IDENTIFIER: "comment_identifier",
+    FIELD_CONDITION: "condition",
+    FIELD_ELSE: "else",
+    FIELD_EXPONENT: "exponent",
+    FIELD_EXPORT_IDENTIFIER: "export_identifier",
+    FIELD_FACT: "fact",
+    FIELD_FACT_IDENTIFIER: "fact_identifier",
+    FIELD_FIRST: "first",
+    FIELD_FORMULA: "formula",
+    FIELD_FROM: "from",
+    FIELD_FUNCTION_IDENTIFIER: "function_identifier",
+    FIELD_FUNCTION_TYPE: "function_type",
+    FIELD_IN: "in",
+    FIELD_LEFT: "left",
+    FIELD_LEMMA_IDENTIFIER: "lemma_identifier",
+    FIELD_LET_IDENTIFIER: "let_identifier",
+    FIELD_LOCATION_IDENTIFIER: "location_identifier",
+    FIELD_MACRO_IDENTIFIER: "macro_identifier",
+    FIELD_PREDICATE_IDENTIFIER: "predicate_identifier",
+    FIELD_PROOF_METHOD_RANKING: "proof_method_ranking",
+    FIELD_PROOF_SKELETON: "proof_skeleton",
+    FIELD_RESTRICTION_IDENTIFIER: "restriction_identifier",
+    FIELD_RIGHT: "right",
+    FIELD_ROLE_IDENTIFIER: "role_identifier",
+    FIELD_RULE_IDENTIFIER: "rule_identifier",
+    FIELD_SECOND: "second",
+    FIELD_TERM: "term",
+    FIELD_TEST_IDENTIFIER: "test_identifier",
+    FIELD_THEN: "then",
+    FIELD_THEORY_NAME: "theory_name",
+    FIELD_TO: "to",
+    FIELD_VARIABLE: "variable",
+    FIELD_VARIABLE_IDENTIFIER: "variable_identifier",
+    FIELD_VARIABLE_TYPE: "variable_type",
+}
+
+
+class NodeWrapper:
+    """Thin wrapper around a tree-sitter node."""
+
+    __slots__ = ("node",)
+    KIND_ID = -1
+
+    def __init__(self, node: "Node"):
+        self.node = node
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.node!r})"
+
+    def _child_of_kind(self, kind_id: int) -> Optional["Node"]:
+        for child in self.node.named_children:
+            if child.kind_id == kind_id:
+                return child
+        return None
+
+    def _children_of_kind(self, kind_id: int) -> List["Node"]:
+        return [c for c in self.node.named_children if c.kind_id == kind_id]
+
+
+class Ident(NodeWrapper):
+    """Typed view of a ``ident`` node."""
+
+    __slots__ = ()
+    KIND_ID = IDENT
+
+
+class StandardProofMethodRanking(NodeWrapper):
+    """Typed view of a ``standard_proof_method_ranking`` node."""
+
+    __slots__ = ()
+    KIND_ID = STANDARD_PROOF_METHOD_RANKING
+
+
+class Null(NodeWrapper):
+    """Typed view of a ``null`` node."""
+
+    __slots__ = ()
+    KIND_ID = NULL
+
+
+class Solved(NodeWrapper):
+    """Typed view of a ``solved`` node."""
+
+    __slots__ = ()
+    KIND_ID = SOLVED
+
+
+class Mirrored(NodeWrapper):
+    """Typed view of a ``mirrored`` node."""
+
+    __slots__ = ()
+    KIND_ID = MIRRORED
+
+
+class Param(NodeWrapper):
+    """Typed view of a ``param`` node."""
+
+    __slots__ = ()
+    KIND_ID = PARAM
+
+
+class ExportQuery(NodeWrapper):
+    """Typed view of a ``export_query`` node."""
+
+    __slots__ = ()
+    KIND_ID = EXPORT_QUERY
+
+
+class Natural(NodeWrapper):
+    """Typed view of a ``natural`` node."""
+
+    __slots__ = ()
+    KIND_ID = NATURAL
+
+
+class MultiComment(NodeWrapper):
+    """Typed view of a ``multi_comment`` node."""
+
+    __slots__ = ()
+    KIND_ID = MULTI_COMMENT
+
+
+class SingleComment(NodeWrapper):
+    """Typed view of a ``single_comment`` node."""
+
+    __slots__ = ()
+    KIND_ID = SINGLE_COMMENT
+
+
+class Theory(NodeWrapper):
+    """Typed view of a ``theory`` node."""
+
+    __slots__ = ()
+    KIND_ID = THEORY
+
+    @property
+    def theory_name(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_THEORY_NAME)
+
+    @property
+    def accountability_lemma(self) -> List["Node"]:
+        return self._children_of_kind(ACCOUNTABILITY_LEMMA)
+
+    @property
+    def built_ins(self) -> List["Node"]:
+        return self._children_of_kind(BUILT_INS)
+
+    @property
+    def case_test(self) -> List["Node"]:
+        return self._children_of_kind(CASE_TEST)
+
+    @property
+    def commandline(self) -> Optional["Node"]:
+        return self._child_of_kind(COMMANDLINE)
+
+    @property
+    def diff_equiv_lemma(self) -> List["Node"]:
+        return self._children_of_kind(DIFF_EQUIV_LEMMA)
+
+    @property
+    def diff_lemma(self) -> List["Node"]:
+        return self._children_of_kind(DIFF_LEMMA)
+
+    @property
+    def diff_rule(self) -> List["Node"]:
+        return self._children_of_kind(DIFF_RULE)
+
+    @property
+    def equations(self) -> List["Node"]:
+        return self._children_of_kind(EQUATIONS)
+
+    @property
+    def equiv_lemma(self) -> List["Node"]:
+        return self._children_of_kind(EQUIV_LEMMA)
+
+    @property
+    def export(self) -> List["Node"]:
+        return self._children_of_kind(EXPORT)
+
+    @property
+    def formal_comment(self) -> List["Node"]:
+        return self._children_of_kind(FORMAL_COMMENT)
+
+    @property
+    def functions(self) -> List["Node"]:
+        return self._children_of_kind(FUNCTIONS)
+
+    @property
+    def global_heuristic(self) -> List["Node"]:
+        return self._children_of_kind(GLOBAL_HEURISTIC)
+
+    @property
+    def lemma(self) -> List["Node"]:
+        return self._children_of_kind(LEMMA)
+
+    @property
+    def let(self) -> List["Node"]:
+        return self._children_of_kind(LET)
+
+    @property
+    def macros(self) -> List["Node"]:
+        return self._children_of_kind(MACROS)
+
+    @property
+    def options(self) -> List["Node"]:
+        return self._children_of_kind(OPTIONS)
+
+    @property
+    def predicates(self) -> List["Node"]:
+        return self._children_of_kind(PREDICATES)
+
+    @property
+    def preprocessor(self) -> List["Node"]:
+        return self._children_of_kind(PREPROCESSOR)
+
+    @property
+    def process(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS)
+
+    @property
+    def restriction(self) -> List["Node"]:
+        return self._children_of_kind(RESTRICTION)
+
+    @property
+    def rule(self) -> List["Node"]:
+        return self._children_of_kind(RULE)
+
+    @property
+    def tactic(self) -> List["Node"]:
+        return self._children_of_kind(TACTIC)
+
+
+class Commandline(NodeWrapper):
+    """Typed view of a ``commandline`` node."""
+
+    __slots__ = ()
+    KIND_ID = COMMANDLINE
+
+
+class Preprocessor(NodeWrapper):
+    """Typed view of a ``preprocessor`` node."""
+
+    __slots__ = ()
+    KIND_ID = PREPROCESSOR
+
+    @property
+    def define(self) -> Optional["Node"]:
+        return self._child_of_kind(DEFINE)
+
+    @property
+    def ifdef(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF)
+
+    @property
+    def include(self) -> Optional["Node"]:
+        return self._child_of_kind(INCLUDE)
+
+
+class Ifdef(NodeWrapper):
+    """Typed view of a ``ifdef`` node."""
+
+    __slots__ = ()
+    KIND_ID = IFDEF
+
+    @property
+    def accountability_lemma(self) -> List["Node"]:
+        return self._children_of_kind(ACCOUNTABILITY_LEMMA)
+
+    @property
+    def built_ins(self) -> List["Node"]:
+        return self._children_of_kind(BUILT_INS)
+
+    @property
+    def case_test(self) -> List["Node"]:
+        return self._children_of_kind(CASE_TEST)
+
+    @property
+    def diff_equiv_lemma(self) -> List["Node"]:
+        return self._children_of_kind(DIFF_EQUIV_LEMMA)
+
+    @property
+    def diff_lemma(self) -> List["Node"]:
+        return self._children_of_kind(DIFF_LEMMA)
+
+    @property
+    def diff_rule(self) -> List["Node"]:
+        return self._children_of_kind(DIFF_RULE)
+
+    @property
+    def equations(self) -> List["Node"]:
+        return self._children_of_kind(EQUATIONS)
+
+    @property
+    def equiv_lemma(self) -> List["Node"]:
+        return self._children_of_kind(EQUIV_LEMMA)
+
+    @property
+    def export(self) -> List["Node"]:
+        return self._children_of_kind(EXPORT)
+
+    @property
+    def formal_comment(self) -> List["Node"]:
+        return self._children_of_kind(FORMAL_COMMENT)
+
+    @property
+    def functions(self) -> List["Node"]:
+        return self._children_of_kind(FUNCTIONS)
+
+    @property
+    def global_heuristic(self) -> List["Node"]:
+        return self._children_of_kind(GLOBAL_HEURISTIC)
+
+    @property
+    def ident(self) -> Optional["Node"]:
+        return self._child_of_kind(IDENT)
+
+    @property
+    def ifdef_and(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF_AND)
+
+    @property
+    def ifdef_nested(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF_NESTED)
+
+    @property
+    def ifdef_not(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF_NOT)
+
+    @property
+    def ifdef_or(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF_OR)
+
+    @property
+    def lemma(self) -> List["Node"]:
+        return self._children_of_kind(LEMMA)
+
+    @property
+    def let(self) -> List["Node"]:
+        return self._children_of_kind(LET)
+
+    @property
+    def macros(self) -> List["Node"]:
+        return self._children_of_kind(MACROS)
+
+    @property
+    def options(self) -> List["Node"]:
+        return self._children_of_kind(OPTIONS)
+
+    @property
+    def predicates(self) -> List["Node"]:
+        return self._children_of_kind(PREDICATES)
+
+    @property
+    def preprocessor(self) -> List["Node"]:
+        return self._children_of_kind(PREPROCESSOR)
+
+    @property
+    def process(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS)
+
+    @property
+    def restriction(self) -> List["Node"]:
+        return self._children_of_kind(RESTRICTION)
+
+    @property
+    def rule(self) -> List["Node"]:
+        return self._children_of_kind(RULE)
+
+    @property
+    def tactic(self) -> List["Node"]:
+        return self._children_of_kind(TACTIC)
+
+
+class Define(NodeWrapper):
+    """Typed view of a ``define`` node."""
+
+    __slots__ = ()
+    KIND_ID = DEFINE
+
+    @property
+    def ident(self) -> Optional["Node"]:
+        return self._child_of_kind(IDENT)
+
+
+class Include(NodeWrapper):
+    """Typed view of a ``include`` node."""
+
+    __slots__ = ()
+    KIND_ID = INCLUDE
+
+    @property
+    def path(self) -> Optional["Node"]:
+        return self._child_of_kind(PATH)
+
+
+class IfdefNested(NodeWrapper):
+    """Typed view of a ``ifdef_nested`` node."""
+
+    __slots__ = ()
+    KIND_ID = IFDEF_NESTED
+
+    @property
+    def ident(self) -> Optional["Node"]:
+        return self._child_of_kind(IDENT)
+
+    @property
+    def ifdef_and(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF_AND)
+
+    @property
+    def ifdef_nested(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF_NESTED)
+
+    @property
+    def ifdef_not(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF_NOT)
+
+    @property
+    def ifdef_or(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF_OR)
+
+
+class IfdefOr(NodeWrapper):
+    """Typed view of a ``ifdef_or`` node."""
+
+    __slots__ = ()
+    KIND_ID = IFDEF_OR
+
+    @property
+    def ident(self) -> List["Node"]:
+        return self._children_of_kind(IDENT)
+
+    @property
+    def ifdef_and(self) -> List["Node"]:
+        return self._children_of_kind(IFDEF_AND)
+
+    @property
+    def ifdef_nested(self) -> List["Node"]:
+        return self._children_of_kind(IFDEF_NESTED)
+
+    @property
+    def ifdef_not(self) -> List["Node"]:
+        return self._children_of_kind(IFDEF_NOT)
+
+    @property
+    def ifdef_or(self) -> List["Node"]:
+        return self._children_of_kind(IFDEF_OR)
+
+
+class IfdefAnd(NodeWrapper):
+    """Typed view of a ``ifdef_and`` node."""
+
+    __slots__ = ()
+    KIND_ID = IFDEF_AND
+
+    @property
+    def ident(self) -> List["Node"]:
+        return self._children_of_kind(IDENT)
+
+    @property
+    def ifdef_and(self) -> List["Node"]:
+        return self._children_of_kind(IFDEF_AND)
+
+    @property
+    def ifdef_nested(self) -> List["Node"]:
+        return self._children_of_kind(IFDEF_NESTED)
+
+    @property
+    def ifdef_not(self) -> List["Node"]:
+        return self._children_of_kind(IFDEF_NOT)
+
+    @property
+    def ifdef_or(self) -> List["Node"]:
+        return self._children_of_kind(IFDEF_OR)
+
+
+class IfdefNot(NodeWrapper):
+    """Typed view of a ``ifdef_not`` node."""
+
+    __slots__ = ()
+    KIND_ID = IFDEF_NOT
+
+    @property
+    def ident(self) -> Optional["Node"]:
+        return self._child_of_kind(IDENT)
+
+    @property
+    def ifdef_and(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF_AND)
+
+    @property
+    def ifdef_nested(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF_NESTED)
+
+    @property
+    def ifdef_not(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF_NOT)
+
+    @property
+    def ifdef_or(self) -> Optional["Node"]:
+        return self._child_of_kind(IFDEF_OR)
+
+
+class BuiltIns(NodeWrapper):
+    """Typed view of a ``built_ins`` node."""
+
+    __slots__ = ()
+    KIND_ID = BUILT_INS
+
+    @property
+    def built_in(self) -> List["Node"]:
+        return self._children_of_kind(BUILT_IN)
+
+
+class BuiltIn(NodeWrapper):
+    """Typed view of a ``built_in`` node."""
+
+    __slots__ = ()
+    KIND_ID = BUILT_IN
+
+
+class Functions(NodeWrapper):
+    """Typed view of a ``functions`` node."""
+
+    __slots__ = ()
+    KIND_ID = FUNCTIONS
+
+    @property
+    def function_typed(self) -> List["Node"]:
+        return self._children_of_kind(FUNCTION_TYPED)
+
+    @property
+    def function_untyped(self) -> List["Node"]:
+        return self._children_of_kind(FUNCTION_UNTYPED)
+
+
+class FunctionUntyped(NodeWrapper):
+    """Typed view of a ``function_untyped`` node."""
+
+    __slots__ = ()
+    KIND_ID = FUNCTION_UNTYPED
+
+    @property
+    def arity(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_ARITY)
+
+    @property
+    def function_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FUNCTION_IDENTIFIER)
+
+    @property
+    def function_attribute(self) -> List["Node"]:
+        return self._children_of_kind(FUNCTION_ATTRIBUTE)
+
+
+class FunctionAttribute(NodeWrapper):
+    """Typed view of a ``function_attribute`` node."""
+
+    __slots__ = ()
+    KIND_ID = FUNCTION_ATTRIBUTE
+
+
+class FunctionTyped(NodeWrapper):
+    """Typed view of a ``function_typed`` node."""
+
+    __slots__ = ()
+    KIND_ID = FUNCTION_TYPED
+
+    @property
+    def function_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FUNCTION_IDENTIFIER)
+
+    @property
+    def function_type(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FUNCTION_TYPE)
+
+    @property
+    def arguments(self) -> Optional["Node"]:
+        return self._child_of_kind(ARGUMENTS)
+
+
+class Equations(NodeWrapper):
+    """Typed view of a ``equations`` node."""
+
+    __slots__ = ()
+    KIND_ID = EQUATIONS
+
+    @property
+    def equation(self) -> List["Node"]:
+        return self._children_of_kind(EQUATION)
+
+
+class Equation(NodeWrapper):
+    """Typed view of a ``equation`` node."""
+
+    __slots__ = ()
+    KIND_ID = EQUATION
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RIGHT)
+
+
+class Predicates(NodeWrapper):
+    """Typed view of a ``predicates`` node."""
+
+    __slots__ = ()
+    KIND_ID = PREDICATES
+
+    @property
+    def predicate(self) -> List["Node"]:
+        return self._children_of_kind(PREDICATE)
+
+
+class Predicate(NodeWrapper):
+    """Typed view of a ``predicate`` node."""
+
+    __slots__ = ()
+    KIND_ID = PREDICATE
+
+    @property
+    def formula(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FORMULA)
+
+
+class Options(NodeWrapper):
+    """Typed view of a ``options`` node."""
+
+    __slots__ = ()
+    KIND_ID = OPTIONS
+
+    @property
+    def option(self) -> List["Node"]:
+        return self._children_of_kind(OPTION)
+
+
+class Option(NodeWrapper):
+    """Typed view of a ``option`` node."""
+
+    __slots__ = ()
+    KIND_ID = OPTION
+
+
+class GlobalHeuristic(NodeWrapper):
+    """Typed view of a ``global_heuristic`` node."""
+
+    __slots__ = ()
+    KIND_ID = GLOBAL_HEURISTIC
+
+    @property
+    def proof_method_ranking(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_PROOF_METHOD_RANKING)
+
+
+class OracleProofMethodRanking(NodeWrapper):
+    """Typed view of a ``oracle_proof_method_ranking`` node."""
+
+    __slots__ = ()
+    KIND_ID = ORACLE_PROOF_METHOD_RANKING
+
+    @property
+    def param(self) -> Optional["Node"]:
+        return self._child_of_kind(PARAM)
+
+
+class TacticProofMethodRanking(NodeWrapper):
+    """Typed view of a ``tactic_proof_method_ranking`` node."""
+
+    __slots__ = ()
+    KIND_ID = TACTIC_PROOF_METHOD_RANKING
+
+    @property
+    def ident(self) -> Optional["Node"]:
+        return self._child_of_kind(IDENT)
+
+
+class Tactic(NodeWrapper):
+    """Typed view of a ``tactic`` node."""
+
+    __slots__ = ()
+    KIND_ID = TACTIC
+
+    @property
+    def deprio(self) -> List["Node"]:
+        return self._children_of_kind(DEPRIO)
+
+    @property
+    def ident(self) -> Optional["Node"]:
+        return self._child_of_kind(IDENT)
+
+    @property
+    def presort(self) -> Optional["Node"]:
+        return self._child_of_kind(PRESORT)
+
+    @property
+    def prio(self) -> List["Node"]:
+        return self._children_of_kind(PRIO)
+
+
+class Presort(NodeWrapper):
+    """Typed view of a ``presort`` node."""
+
+    __slots__ = ()
+    KIND_ID = PRESORT
+
+    @property
+    def standard_proof_method_ranking(self) -> Optional["Node"]:
+        return self._child_of_kind(STANDARD_PROOF_METHOD_RANKING)
+
+
+class Prio(NodeWrapper):
+    """Typed view of a ``prio`` node."""
+
+    __slots__ = ()
+    KIND_ID = PRIO
+
+    @property
+    def and_function(self) -> List["Node"]:
+        return self._children_of_kind(AND_FUNCTION)
+
+    @property
+    def not_function(self) -> List["Node"]:
+        return self._children_of_kind(NOT_FUNCTION)
+
+    @property
+    def or_function(self) -> List["Node"]:
+        return self._children_of_kind(OR_FUNCTION)
+
+    @property
+    def post_ranking(self) -> Optional["Node"]:
+        return self._child_of_kind(POST_RANKING)
+
+    @property
+    def std_function(self) -> List["Node"]:
+        return self._children_of_kind(STD_FUNCTION)
+
+
+class Deprio(NodeWrapper):
+    """Typed view of a ``deprio`` node."""
+
+    __slots__ = ()
+    KIND_ID = DEPRIO
+
+    @property
+    def and_function(self) -> List["Node"]:
+        return self._children_of_kind(AND_FUNCTION)
+
+    @property
+    def not_function(self) -> List["Node"]:
+        return self._children_of_kind(NOT_FUNCTION)
+
+    @property
+    def or_function(self) -> List["Node"]:
+        return self._children_of_kind(OR_FUNCTION)
+
+    @property
+    def post_ranking(self) -> Optional["Node"]:
+        return self._child_of_kind(POST_RANKING)
+
+    @property
+    def std_function(self) -> List["Node"]:
+        return self._children_of_kind(STD_FUNCTION)
+
+
+class PostRanking(NodeWrapper):
+    """Typed view of a ``post_ranking`` node."""
+
+    __slots__ = ()
+    KIND_ID = POST_RANKING
+
+
+class OrFunction(NodeWrapper):
+    """Typed view of a ``or_function`` node."""
+
+    __slots__ = ()
+    KIND_ID = OR_FUNCTION
+
+    @property
+    def and_function(self) -> List["Node"]:
+        return self._children_of_kind(AND_FUNCTION)
+
+    @property
+    def not_function(self) -> List["Node"]:
+        return self._children_of_kind(NOT_FUNCTION)
+
+    @property
+    def or_function(self) -> List["Node"]:
+        return self._children_of_kind(OR_FUNCTION)
+
+    @property
+    def std_function(self) -> List["Node"]:
+        return self._children_of_kind(STD_FUNCTION)
+
+
+class AndFunction(NodeWrapper):
+    """Typed view of a ``and_function`` node."""
+
+    __slots__ = ()
+    KIND_ID = AND_FUNCTION
+
+    @property
+    def and_function(self) -> List["Node"]:
+        return self._children_of_kind(AND_FUNCTION)
+
+    @property
+    def not_function(self) -> List["Node"]:
+        return self._children_of_kind(NOT_FUNCTION)
+
+    @property
+    def or_function(self) -> List["Node"]:
+        return self._children_of_kind(OR_FUNCTION)
+
+    @property
+    def std_function(self) -> List["Node"]:
+        return self._children_of_kind(STD_FUNCTION)
+
+
+class NotFunction(NodeWrapper):
+    """Typed view of a ``not_function`` node."""
+
+    __slots__ = ()
+    KIND_ID = NOT_FUNCTION
+
+    @property
+    def and_function(self) -> Optional["Node"]:
+        return self._child_of_kind(AND_FUNCTION)
+
+    @property
+    def not_function(self) -> Optional["Node"]:
+        return self._child_of_kind(NOT_FUNCTION)
+
+    @property
+    def or_function(self) -> Optional["Node"]:
+        return self._child_of_kind(OR_FUNCTION)
+
+    @property
+    def std_function(self) -> Optional["Node"]:
+        return self._child_of_kind(STD_FUNCTION)
+
+
+class StdFunction(NodeWrapper):
+    """Typed view of a ``std_function`` node."""
+
+    __slots__ = ()
+    KIND_ID = STD_FUNCTION
+
+    @property
+    def function_name(self) -> Optional["Node"]:
+        return self._child_of_kind(FUNCTION_NAME)
+
+    @property
+    def param(self) -> List["Node"]:
+        return self._children_of_kind(PARAM)
+
+
+class FunctionName(NodeWrapper):
+    """Typed view of a ``function_name`` node."""
+
+    __slots__ = ()
+    KIND_ID = FUNCTION_NAME
+
+
+class Process(NodeWrapper):
+    """Typed view of a ``process`` node."""
+
+    __slots__ = ()
+    KIND_ID = PROCESS
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class LocationProcess(NodeWrapper):
+    """Typed view of a ``location_process`` node."""
+
+    __slots__ = ()
+    KIND_ID = LOCATION_PROCESS
+
+    @property
+    def location_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LOCATION_IDENTIFIER)
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class InlineMsrProcess(NodeWrapper):
+    """Typed view of a ``inline_msr_process`` node."""
+
+    __slots__ = ()
+    KIND_ID = INLINE_MSR_PROCESS
+
+    @property
+    def action_fact(self) -> Optional["Node"]:
+        return self._child_of_kind(ACTION_FACT)
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conclusion(self) -> Optional["Node"]:
+        return self._child_of_kind(CONCLUSION)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def premise(self) -> Optional["Node"]:
+        return self._child_of_kind(PREMISE)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class PredefinedProcess(NodeWrapper):
+    """Typed view of a ``predefined_process`` node."""
+
+    __slots__ = ()
+    KIND_ID = PREDEFINED_PROCESS
+
+    @property
+    def mset_term(self) -> Optional["Node"]:
+        return self._child_of_kind(MSET_TERM)
+
+
+class Binding(NodeWrapper):
+    """Typed view of a ``binding`` node."""
+
+    __slots__ = ()
+    KIND_ID = BINDING
+
+    @property
+    def any_var(self) -> Optional["Node"]:
+        return self._child_of_kind(ANY_VAR)
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def comp_var(self) -> Optional["Node"]:
+        return self._child_of_kind(COMP_VAR)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def custom_var(self) -> Optional["Node"]:
+        return self._child_of_kind(CUSTOM_VAR)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def fresh_name(self) -> Optional["Node"]:
+        return self._child_of_kind(FRESH_NAME)
+
+    @property
+    def fresh_var(self) -> Optional["Node"]:
+        return self._child_of_kind(FRESH_VAR)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def msg_var_or_nullary_fun(self) -> Optional["Node"]:
+        return self._child_of_kind(MSG_VAR_OR_NULLARY_FUN)
+
+    @property
+    def nat_var(self) -> Optional["Node"]:
+        return self._child_of_kind(NAT_VAR)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def pub_name(self) -> Optional["Node"]:
+        return self._child_of_kind(PUB_NAME)
+
+    @property
+    def pub_var(self) -> Optional["Node"]:
+        return self._child_of_kind(PUB_VAR)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class Output(NodeWrapper):
+    """Typed view of a ``output`` node."""
+
+    __slots__ = ()
+    KIND_ID = OUTPUT
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def mset_term(self) -> List["Node"]:
+        return self._children_of_kind(MSET_TERM)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class Input(NodeWrapper):
+    """Typed view of a ``input`` node."""
+
+    __slots__ = ()
+    KIND_ID = INPUT
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def mset_term(self) -> List["Node"]:
+        return self._children_of_kind(MSET_TERM)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class Conditional(NodeWrapper):
+    """Typed view of a ``conditional`` node."""
+
+    __slots__ = ()
+    KIND_ID = CONDITIONAL
+
+    @property
+    def condition(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_CONDITION)
+
+    @property
+    def else_(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_ELSE)
+
+    @property
+    def then(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_THEN)
+
+
+class ProcessLet(NodeWrapper):
+    """Typed view of a ``process_let`` node."""
+
+    __slots__ = ()
+    KIND_ID = PROCESS_LET
+
+    @property
+    def else_(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_ELSE)
+
+    @property
+    def in_(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_IN)
+
+    @property
+    def term_eq(self) -> List["Node"]:
+        return self._children_of_kind(TERM_EQ)
+
+
+class DeterministicChoice(NodeWrapper):
+    """Typed view of a ``deterministic_choice`` node."""
+
+    __slots__ = ()
+    KIND_ID = DETERMINISTIC_CHOICE
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class NonDeterministicChoice(NodeWrapper):
+    """Typed view of a ``non_deterministic_choice`` node."""
+
+    __slots__ = ()
+    KIND_ID = NON_DETERMINISTIC_CHOICE
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class Event(NodeWrapper):
+    """Typed view of a ``event`` node."""
+
+    __slots__ = ()
+    KIND_ID = EVENT
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def linear_fact(self) -> Optional["Node"]:
+        return self._child_of_kind(LINEAR_FACT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def persistent_fact(self) -> Optional["Node"]:
+        return self._child_of_kind(PERSISTENT_FACT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class Replication(NodeWrapper):
+    """Typed view of a ``replication`` node."""
+
+    __slots__ = ()
+    KIND_ID = REPLICATION
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class SetState(NodeWrapper):
+    """Typed view of a ``set_state`` node."""
+
+    __slots__ = ()
+    KIND_ID = SET_STATE
+
+    @property
+    def from_(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FROM)
+
+    @property
+    def to(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_TO)
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class DeleteState(NodeWrapper):
+    """Typed view of a ``delete_state`` node."""
+
+    __slots__ = ()
+    KIND_ID = DELETE_STATE
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def mset_term(self) -> Optional["Node"]:
+        return self._child_of_kind(MSET_TERM)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class ReadState(NodeWrapper):
+    """Typed view of a ``read_state`` node."""
+
+    __slots__ = ()
+    KIND_ID = READ_STATE
+
+    @property
+    def else_(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_ELSE)
+
+    @property
+    def from_(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FROM)
+
+    @property
+    def in_(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_IN)
+
+    @property
+    def to(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_TO)
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class SetLock(NodeWrapper):
+    """Typed view of a ``set_lock`` node."""
+
+    __slots__ = ()
+    KIND_ID = SET_LOCK
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def mset_term(self) -> Optional["Node"]:
+        return self._child_of_kind(MSET_TERM)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class RemoveLock(NodeWrapper):
+    """Typed view of a ``remove_lock`` node."""
+
+    __slots__ = ()
+    KIND_ID = REMOVE_LOCK
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def mset_term(self) -> Optional["Node"]:
+        return self._child_of_kind(MSET_TERM)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class EqualityCheck(NodeWrapper):
+    """Typed view of a ``equality_check`` node."""
+
+    __slots__ = ()
+    KIND_ID = EQUALITY_CHECK
+
+    @property
+    def action_constraint(self) -> List["Node"]:
+        return self._children_of_kind(ACTION_CONSTRAINT)
+
+    @property
+    def atom(self) -> List["Node"]:
+        return self._children_of_kind(ATOM)
+
+    @property
+    def conjunction(self) -> List["Node"]:
+        return self._children_of_kind(CONJUNCTION)
+
+    @property
+    def disjunction(self) -> List["Node"]:
+        return self._children_of_kind(DISJUNCTION)
+
+    @property
+    def iff(self) -> List["Node"]:
+        return self._children_of_kind(IFF)
+
+    @property
+    def imp(self) -> List["Node"]:
+        return self._children_of_kind(IMP)
+
+    @property
+    def mset_term(self) -> List["Node"]:
+        return self._children_of_kind(MSET_TERM)
+
+    @property
+    def negation(self) -> List["Node"]:
+        return self._children_of_kind(NEGATION)
+
+    @property
+    def nested_formula(self) -> List["Node"]:
+        return self._children_of_kind(NESTED_FORMULA)
+
+    @property
+    def pre_defined(self) -> List["Node"]:
+        return self._children_of_kind(PRE_DEFINED)
+
+    @property
+    def predicate_ref(self) -> List["Node"]:
+        return self._children_of_kind(PREDICATE_REF)
+
+    @property
+    def quantified_formula(self) -> List["Node"]:
+        return self._children_of_kind(QUANTIFIED_FORMULA)
+
+    @property
+    def subterm_rel(self) -> List["Node"]:
+        return self._children_of_kind(SUBTERM_REL)
+
+    @property
+    def temp_var_eq(self) -> List["Node"]:
+        return self._children_of_kind(TEMP_VAR_EQ)
+
+    @property
+    def temp_var_induction(self) -> List["Node"]:
+        return self._children_of_kind(TEMP_VAR_INDUCTION)
+
+    @property
+    def temp_var_order(self) -> List["Node"]:
+        return self._children_of_kind(TEMP_VAR_ORDER)
+
+    @property
+    def term_eq(self) -> List["Node"]:
+        return self._children_of_kind(TERM_EQ)
+
+
+class LesserCheck(NodeWrapper):
+    """Typed view of a ``lesser_check`` node."""
+
+    __slots__ = ()
+    KIND_ID = LESSER_CHECK
+
+    @property
+    def mset_term(self) -> List["Node"]:
+        return self._children_of_kind(MSET_TERM)
+
+
+class Let(NodeWrapper):
+    """Typed view of a ``let`` node."""
+
+    __slots__ = ()
+    KIND_ID = LET
+
+    @property
+    def let_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LET_IDENTIFIER)
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class Export(NodeWrapper):
+    """Typed view of a ``export`` node."""
+
+    __slots__ = ()
+    KIND_ID = EXPORT
+
+    @property
+    def export_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_EXPORT_IDENTIFIER)
+
+    @property
+    def export_query(self) -> Optional["Node"]:
+        return self._child_of_kind(EXPORT_QUERY)
+
+
+class Rule(NodeWrapper):
+    """Typed view of a ``rule`` node."""
+
+    __slots__ = ()
+    KIND_ID = RULE
+
+    @property
+    def simple_rule(self) -> Optional["Node"]:
+        return self._child_of_kind(SIMPLE_RULE)
+
+    @property
+    def variants(self) -> Optional["Node"]:
+        return self._child_of_kind(VARIANTS)
+
+
+class DiffRule(NodeWrapper):
+    """Typed view of a ``diff_rule`` node."""
+
+    __slots__ = ()
+    KIND_ID = DIFF_RULE
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RIGHT)
+
+    @property
+    def simple_rule(self) -> Optional["Node"]:
+        return self._child_of_kind(SIMPLE_RULE)
+
+
+class SimpleRule(NodeWrapper):
+    """Typed view of a ``simple_rule`` node."""
+
+    __slots__ = ()
+    KIND_ID = SIMPLE_RULE
+
+    @property
+    def rule_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RULE_IDENTIFIER)
+
+    @property
+    def action_fact(self) -> Optional["Node"]:
+        return self._child_of_kind(ACTION_FACT)
+
+    @property
+    def conclusion(self) -> Optional["Node"]:
+        return self._child_of_kind(CONCLUSION)
+
+    @property
+    def modulo(self) -> Optional["Node"]:
+        return self._child_of_kind(MODULO)
+
+    @property
+    def premise(self) -> Optional["Node"]:
+        return self._child_of_kind(PREMISE)
+
+    @property
+    def rule_attrs(self) -> Optional["Node"]:
+        return self._child_of_kind(RULE_ATTRS)
+
+    @property
+    def rule_let_block(self) -> Optional["Node"]:
+        return self._child_of_kind(RULE_LET_BLOCK)
+
+
+class Premise(NodeWrapper):
+    """Typed view of a ``premise`` node."""
+
+    __slots__ = ()
+    KIND_ID = PREMISE
+
+    @property
+    def linear_fact(self) -> List["Node"]:
+        return self._children_of_kind(LINEAR_FACT)
+
+    @property
+    def persistent_fact(self) -> List["Node"]:
+        return self._children_of_kind(PERSISTENT_FACT)
+
+
+class ActionFact(NodeWrapper):
+    """Typed view of a ``action_fact`` node."""
+
+    __slots__ = ()
+    KIND_ID = ACTION_FACT
+
+    @property
+    def embedded_restriction(self) -> List["Node"]:
+        return self._children_of_kind(EMBEDDED_RESTRICTION)
+
+    @property
+    def linear_fact(self) -> List["Node"]:
+        return self._children_of_kind(LINEAR_FACT)
+
+    @property
+    def persistent_fact(self) -> List["Node"]:
+        return self._children_of_kind(PERSISTENT_FACT)
+
+
+class Conclusion(NodeWrapper):
+    """Typed view of a ``conclusion`` node."""
+
+    __slots__ = ()
+    KIND_ID = CONCLUSION
+
+    @property
+    def linear_fact(self) -> List["Node"]:
+        return self._children_of_kind(LINEAR_FACT)
+
+    @property
+    def persistent_fact(self) -> List["Node"]:
+        return self._children_of_kind(PERSISTENT_FACT)
+
+
+class Variants(NodeWrapper):
+    """Typed view of a ``variants`` node."""
+
+    __slots__ = ()
+    KIND_ID = VARIANTS
+
+    @property
+    def simple_rule(self) -> List["Node"]:
+        return self._children_of_kind(SIMPLE_RULE)
+
+
+class Modulo(NodeWrapper):
+    """Typed view of a ``modulo`` node."""
+
+    __slots__ = ()
+    KIND_ID = MODULO
+
+
+class RuleAttrs(NodeWrapper):
+    """Typed view of a ``rule_attrs`` node."""
+
+    __slots__ = ()
+    KIND_ID = RULE_ATTRS
+
+    @property
+    def rule_attr(self) -> List["Node"]:
+        return self._children_of_kind(RULE_ATTR)
+
+
+class RuleAttr(NodeWrapper):
+    """Typed view of a ``rule_attr`` node."""
+
+    __slots__ = ()
+    KIND_ID = RULE_ATTR
+
+    @property
+    def rule_attr_color(self) -> Optional["Node"]:
+        return self._child_of_kind(RULE_ATTR_COLOR)
+
+    @property
+    def rule_process(self) -> Optional["Node"]:
+        return self._child_of_kind(RULE_PROCESS)
+
+    @property
+    def rule_role(self) -> Optional["Node"]:
+        return self._child_of_kind(RULE_ROLE)
+
+
+class RuleAttrColor(NodeWrapper):
+    """Typed view of a ``rule_attr_color`` node."""
+
+    __slots__ = ()
+    KIND_ID = RULE_ATTR_COLOR
+
+    @property
+    def hexcolor(self) -> Optional["Node"]:
+        return self._child_of_kind(HEXCOLOR)
+
+
+class RuleRole(NodeWrapper):
+    """Typed view of a ``rule_role`` node."""
+
+    __slots__ = ()
+    KIND_ID = RULE_ROLE
+
+    @property
+    def role_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_ROLE_IDENTIFIER)
+
+
+class RuleProcess(NodeWrapper):
+    """Typed view of a ``rule_process`` node."""
+
+    __slots__ = ()
+    KIND_ID = RULE_PROCESS
+
+    @property
+    def ident(self) -> Optional["Node"]:
+        return self._child_of_kind(IDENT)
+
+
+class RuleLetBlock(NodeWrapper):
+    """Typed view of a ``rule_let_block`` node."""
+
+    __slots__ = ()
+    KIND_ID = RULE_LET_BLOCK
+
+    @property
+    def rule_let_term(self) -> List["Node"]:
+        return self._children_of_kind(RULE_LET_TERM)
+
+
+class RuleLetTerm(NodeWrapper):
+    """Typed view of a ``rule_let_term`` node."""
+
+    __slots__ = ()
+    KIND_ID = RULE_LET_TERM
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RIGHT)
+
+
+class Macros(NodeWrapper):
+    """Typed view of a ``macros`` node."""
+
+    __slots__ = ()
+    KIND_ID = MACROS
+
+    @property
+    def macro(self) -> List["Node"]:
+        return self._children_of_kind(MACRO)
+
+
+class Macro(NodeWrapper):
+    """Typed view of a ``macro`` node."""
+
+    __slots__ = ()
+    KIND_ID = MACRO
+
+    @property
+    def macro_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_MACRO_IDENTIFIER)
+
+    @property
+    def term(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_TERM)
+
+    @property
+    def fresh_var(self) -> List["Node"]:
+        return self._children_of_kind(FRESH_VAR)
+
+    @property
+    def msg_var_or_nullary_fun(self) -> List["Node"]:
+        return self._children_of_kind(MSG_VAR_OR_NULLARY_FUN)
+
+    @property
+    def nat_var(self) -> List["Node"]:
+        return self._children_of_kind(NAT_VAR)
+
+    @property
+    def pub_var(self) -> List["Node"]:
+        return self._children_of_kind(PUB_VAR)
+
+
+class EmbeddedRestriction(NodeWrapper):
+    """Typed view of a ``embedded_restriction`` node."""
+
+    __slots__ = ()
+    KIND_ID = EMBEDDED_RESTRICTION
+
+    @property
+    def formula(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FORMULA)
+
+
+class LinearFact(NodeWrapper):
+    """Typed view of a ``linear_fact`` node."""
+
+    __slots__ = ()
+    KIND_ID = LINEAR_FACT
+
+    @property
+    def fact_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FACT_IDENTIFIER)
+
+    @property
+    def arguments(self) -> Optional["Node"]:
+        return self._child_of_kind(ARGUMENTS)
+
+    @property
+    def fact_annotes(self) -> Optional["Node"]:
+        return self._child_of_kind(FACT_ANNOTES)
+
+
+class FactAnnotes(NodeWrapper):
+    """Typed view of a ``fact_annotes`` node."""
+
+    __slots__ = ()
+    KIND_ID = FACT_ANNOTES
+
+    @property
+    def fact_annote(self) -> List["Node"]:
+        return self._children_of_kind(FACT_ANNOTE)
+
+
+class FactAnnote(NodeWrapper):
+    """Typed view of a ``fact_annote`` node."""
+
+    __slots__ = ()
+    KIND_ID = FACT_ANNOTE
+
+
+class Restriction(NodeWrapper):
+    """Typed view of a ``restriction`` node."""
+
+    __slots__ = ()
+    KIND_ID = RESTRICTION
+
+    @property
+    def formula(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FORMULA)
+
+    @property
+    def restriction_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RESTRICTION_IDENTIFIER)
+
+    @property
+    def restriction_attr(self) -> Optional["Node"]:
+        return self._child_of_kind(RESTRICTION_ATTR)
+
+
+class RestrictionAttr(NodeWrapper):
+    """Typed view of a ``restriction_attr`` node."""
+
+    __slots__ = ()
+    KIND_ID = RESTRICTION_ATTR
+
+
+class CaseTest(NodeWrapper):
+    """Typed view of a ``case_test`` node."""
+
+    __slots__ = ()
+    KIND_ID = CASE_TEST
+
+    @property
+    def formula(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FORMULA)
+
+    @property
+    def test_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_TEST_IDENTIFIER)
+
+
+class Lemma(NodeWrapper):
+    """Typed view of a ``lemma`` node."""
+
+    __slots__ = ()
+    KIND_ID = LEMMA
+
+    @property
+    def formula(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FORMULA)
+
+    @property
+    def lemma_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEMMA_IDENTIFIER)
+
+    @property
+    def proof_skeleton(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_PROOF_SKELETON)
+
+    @property
+    def diff_lemma_attrs(self) -> Optional["Node"]:
+        return self._child_of_kind(DIFF_LEMMA_ATTRS)
+
+    @property
+    def modulo(self) -> Optional["Node"]:
+        return self._child_of_kind(MODULO)
+
+    @property
+    def trace_quantifier(self) -> Optional["Node"]:
+        return self._child_of_kind(TRACE_QUANTIFIER)
+
+
+class LemmaAttr(NodeWrapper):
+    """Typed view of a ``lemma_attr`` node."""
+
+    __slots__ = ()
+    KIND_ID = LEMMA_ATTR
+
+    @property
+    def proof_method_ranking(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_PROOF_METHOD_RANKING)
+
+    @property
+    def ident(self) -> Optional["Node"]:
+        return self._child_of_kind(IDENT)
+
+    @property
+    def language(self) -> List["Node"]:
+        return self._children_of_kind(LANGUAGE)
+
+
+class Language(NodeWrapper):
+    """Typed view of a ``language`` node."""
+
+    __slots__ = ()
+    KIND_ID = LANGUAGE
+
+
+class DiffLemma(NodeWrapper):
+    """Typed view of a ``diff_lemma`` node."""
+
+    __slots__ = ()
+    KIND_ID = DIFF_LEMMA
+
+    @property
+    def lemma_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEMMA_IDENTIFIER)
+
+    @property
+    def proof_skeleton(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_PROOF_SKELETON)
+
+    @property
+    def diff_lemma_attrs(self) -> Optional["Node"]:
+        return self._child_of_kind(DIFF_LEMMA_ATTRS)
+
+    @property
+    def modulo(self) -> Optional["Node"]:
+        return self._child_of_kind(MODULO)
+
+
+class DiffLemmaAttrs(NodeWrapper):
+    """Typed view of a ``diff_lemma_attrs`` node."""
+
+    __slots__ = ()
+    KIND_ID = DIFF_LEMMA_ATTRS
+
+    @property
+    def diff_lemma_attr(self) -> List["Node"]:
+        return self._children_of_kind(DIFF_LEMMA_ATTR)
+
+    @property
+    def lemma_attr(self) -> List["Node"]:
+        return self._children_of_kind(LEMMA_ATTR)
+
+
+class DiffLemmaAttr(NodeWrapper):
+    """Typed view of a ``diff_lemma_attr`` node."""
+
+    __slots__ = ()
+    KIND_ID = DIFF_LEMMA_ATTR
+
+
+class AccountabilityLemma(NodeWrapper):
+    """Typed view of a ``accountability_lemma`` node."""
+
+    __slots__ = ()
+    KIND_ID = ACCOUNTABILITY_LEMMA
+
+    @property
+    def formula(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FORMULA)
+
+    @property
+    def lemma_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEMMA_IDENTIFIER)
+
+    @property
+    def test_identifier(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_TEST_IDENTIFIER)
+
+
+class EquivLemma(NodeWrapper):
+    """Typed view of a ``equiv_lemma`` node."""
+
+    __slots__ = ()
+    KIND_ID = EQUIV_LEMMA
+
+    @property
+    def first(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_FIRST)
+
+    @property
+    def second(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_SECOND)
+
+
+class DiffEquivLemma(NodeWrapper):
+    """Typed view of a ``diff_equiv_lemma`` node."""
+
+    __slots__ = ()
+    KIND_ID = DIFF_EQUIV_LEMMA
+
+    @property
+    def binding(self) -> List["Node"]:
+        return self._children_of_kind(BINDING)
+
+    @property
+    def conditional(self) -> List["Node"]:
+        return self._children_of_kind(CONDITIONAL)
+
+    @property
+    def delete_state(self) -> List["Node"]:
+        return self._children_of_kind(DELETE_STATE)
+
+    @property
+    def deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(DETERMINISTIC_CHOICE)
+
+    @property
+    def event(self) -> List["Node"]:
+        return self._children_of_kind(EVENT)
+
+    @property
+    def inline_msr_process(self) -> List["Node"]:
+        return self._children_of_kind(INLINE_MSR_PROCESS)
+
+    @property
+    def input(self) -> List["Node"]:
+        return self._children_of_kind(INPUT)
+
+    @property
+    def location_process(self) -> List["Node"]:
+        return self._children_of_kind(LOCATION_PROCESS)
+
+    @property
+    def non_deterministic_choice(self) -> List["Node"]:
+        return self._children_of_kind(NON_DETERMINISTIC_CHOICE)
+
+    @property
+    def null(self) -> List["Node"]:
+        return self._children_of_kind(NULL)
+
+    @property
+    def output(self) -> List["Node"]:
+        return self._children_of_kind(OUTPUT)
+
+    @property
+    def predefined_process(self) -> List["Node"]:
+        return self._children_of_kind(PREDEFINED_PROCESS)
+
+    @property
+    def process_let(self) -> List["Node"]:
+        return self._children_of_kind(PROCESS_LET)
+
+    @property
+    def read_state(self) -> List["Node"]:
+        return self._children_of_kind(READ_STATE)
+
+    @property
+    def remove_lock(self) -> List["Node"]:
+        return self._children_of_kind(REMOVE_LOCK)
+
+    @property
+    def replication(self) -> List["Node"]:
+        return self._children_of_kind(REPLICATION)
+
+    @property
+    def set_lock(self) -> List["Node"]:
+        return self._children_of_kind(SET_LOCK)
+
+    @property
+    def set_state(self) -> List["Node"]:
+        return self._children_of_kind(SET_STATE)
+
+
+class TraceQuantifier(NodeWrapper):
+    """Typed view of a ``trace_quantifier`` node."""
+
+    __slots__ = ()
+    KIND_ID = TRACE_QUANTIFIER
+
+
+class ByMethod(NodeWrapper):
+    """Typed view of a ``by_method`` node."""
+
+    __slots__ = ()
+    KIND_ID = BY_METHOD
+
+    @property
+    def proof_method(self) -> Optional["Node"]:
+        return self._child_of_kind(PROOF_METHOD)
+
+    @property
+    def step(self) -> List["Node"]:
+        return self._children_of_kind(STEP)
+
+
+class MethodSkeleton(NodeWrapper):
+    """Typed view of a ``method_skeleton`` node."""
+
+    __slots__ = ()
+    KIND_ID = METHOD_SKELETON
+
+    @property
+    def proof_skeleton(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_PROOF_SKELETON)
+
+    @property
+    def proof_method(self) -> Optional["Node"]:
+        return self._child_of_kind(PROOF_METHOD)
+
+    @property
+    def step(self) -> List["Node"]:
+        return self._children_of_kind(STEP)
+
+
+class Cases(NodeWrapper):
+    """Typed view of a ``cases`` node."""
+
+    __slots__ = ()
+    KIND_ID = CASES
+
+    @property
+    def case(self) -> List["Node"]:
+        return self._children_of_kind(CASE)
+
+
+class Case(NodeWrapper):
+    """Typed view of a ``case`` node."""
+
+    __slots__ = ()
+    KIND_ID = CASE
+
+    @property
+    def case_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_CASE_IDENTIFIER)
+
+    @property
+    def proof_skeleton(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_PROOF_SKELETON)
+
+
+class ProofMethod(NodeWrapper):
+    """Typed view of a ``proof_method`` node."""
+
+    __slots__ = ()
+    KIND_ID = PROOF_METHOD
+
+    @property
+    def constraint(self) -> Optional["Node"]:
+        return self._child_of_kind(CONSTRAINT)
+
+
+class Step(NodeWrapper):
+    """Typed view of a ``step`` node."""
+
+    __slots__ = ()
+    KIND_ID = STEP
+
+    @property
+    def proof_method(self) -> Optional["Node"]:
+        return self._child_of_kind(PROOF_METHOD)
+
+
+class Constraint(NodeWrapper):
+    """Typed view of a ``constraint`` node."""
+
+    __slots__ = ()
+    KIND_ID = CONSTRAINT
+
+    @property
+    def action_constraint(self) -> Optional["Node"]:
+        return self._child_of_kind(ACTION_CONSTRAINT)
+
+    @property
+    def chain_constraint(self) -> Optional["Node"]:
+        return self._child_of_kind(CHAIN_CONSTRAINT)
+
+    @property
+    def disjunction_split_constraint(self) -> Optional["Node"]:
+        return self._child_of_kind(DISJUNCTION_SPLIT_CONSTRAINT)
+
+    @property
+    def eq_split_constraint(self) -> Optional["Node"]:
+        return self._child_of_kind(EQ_SPLIT_CONSTRAINT)
+
+    @property
+    def premise_constraint(self) -> Optional["Node"]:
+        return self._child_of_kind(PREMISE_CONSTRAINT)
+
+
+class PremiseConstraint(NodeWrapper):
+    """Typed view of a ``premise_constraint`` node."""
+
+    __slots__ = ()
+    KIND_ID = PREMISE_CONSTRAINT
+
+    @property
+    def linear_fact(self) -> Optional["Node"]:
+        return self._child_of_kind(LINEAR_FACT)
+
+    @property
+    def natural_subscript(self) -> Optional["Node"]:
+        return self._child_of_kind(NATURAL_SUBSCRIPT)
+
+    @property
+    def persistent_fact(self) -> Optional["Node"]:
+        return self._child_of_kind(PERSISTENT_FACT)
+
+    @property
+    def temporal_var(self) -> Optional["Node"]:
+        return self._child_of_kind(TEMPORAL_VAR)
+
+
+class ActionConstraint(NodeWrapper):
+    """Typed view of a ``action_constraint`` node."""
+
+    __slots__ = ()
+    KIND_ID = ACTION_CONSTRAINT
+
+    @property
+    def fact(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_FACT)
+
+    @property
+    def variable(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_VARIABLE)
+
+
+class ChainConstraint(NodeWrapper):
+    """Typed view of a ``chain_constraint`` node."""
+
+    __slots__ = ()
+    KIND_ID = CHAIN_CONSTRAINT
+
+    @property
+    def natural(self) -> List["Node"]:
+        return self._children_of_kind(NATURAL)
+
+    @property
+    def temporal_var(self) -> List["Node"]:
+        return self._children_of_kind(TEMPORAL_VAR)
+
+
+class DisjunctionSplitConstraint(NodeWrapper):
+    """Typed view of a ``disjunction_split_constraint`` node."""
+
+    __slots__ = ()
+    KIND_ID = DISJUNCTION_SPLIT_CONSTRAINT
+
+    @property
+    def formula(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_FORMULA)
+
+
+class EqSplitConstraint(NodeWrapper):
+    """Typed view of a ``eq_split_constraint`` node."""
+
+    __slots__ = ()
+    KIND_ID = EQ_SPLIT_CONSTRAINT
+
+    @property
+    def natural(self) -> Optional["Node"]:
+        return self._child_of_kind(NATURAL)
+
+
+class TupleTerm(NodeWrapper):
+    """Typed view of a ``tuple_term`` node."""
+
+    __slots__ = ()
+    KIND_ID = TUPLE_TERM
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_RIGHT)
+
+
+class MsetTerm(NodeWrapper):
+    """Typed view of a ``mset_term`` node."""
+
+    __slots__ = ()
+    KIND_ID = MSET_TERM
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_RIGHT)
+
+
+class NatTerm(NodeWrapper):
+    """Typed view of a ``nat_term`` node."""
+
+    __slots__ = ()
+    KIND_ID = NAT_TERM
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_RIGHT)
+
+
+class XorTerm(NodeWrapper):
+    """Typed view of a ``xor_term`` node."""
+
+    __slots__ = ()
+    KIND_ID = XOR_TERM
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_RIGHT)
+
+
+class MulTerm(NodeWrapper):
+    """Typed view of a ``mul_term`` node."""
+
+    __slots__ = ()
+    KIND_ID = MUL_TERM
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_RIGHT)
+
+
+class ExpTerm(NodeWrapper):
+    """Typed view of a ``exp_term`` node."""
+
+    __slots__ = ()
+    KIND_ID = EXP_TERM
+
+    @property
+    def base(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_BASE)
+
+    @property
+    def exponent(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_EXPONENT)
+
+
+class NestedTerm(NodeWrapper):
+    """Typed view of a ``nested_term`` node."""
+
+    __slots__ = ()
+    KIND_ID = NESTED_TERM
+
+    @property
+    def mset_term(self) -> Optional["Node"]:
+        return self._child_of_kind(MSET_TERM)
+
+
+class NullaryFun(NodeWrapper):
+    """Typed view of a ``nullary_fun`` node."""
+
+    __slots__ = ()
+    KIND_ID = NULLARY_FUN
+
+    @property
+    def function_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FUNCTION_IDENTIFIER)
+
+
+class BinaryApp(NodeWrapper):
+    """Typed view of a ``binary_app`` node."""
+
+    __slots__ = ()
+    KIND_ID = BINARY_APP
+
+    @property
+    def argument(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_ARGUMENT)
+
+    @property
+    def function_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FUNCTION_IDENTIFIER)
+
+
+class NaryApp(NodeWrapper):
+    """Typed view of a ``nary_app`` node."""
+
+    __slots__ = ()
+    KIND_ID = NARY_APP
+
+    @property
+    def function_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FUNCTION_IDENTIFIER)
+
+    @property
+    def arguments(self) -> Optional["Node"]:
+        return self._child_of_kind(ARGUMENTS)
+
+
+class Arguments(NodeWrapper):
+    """Typed view of a ``arguments`` node."""
+
+    __slots__ = ()
+    KIND_ID = ARGUMENTS
+
+    @property
+    def argument(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_ARGUMENT)
+
+
+class PubVar(NodeWrapper):
+    """Typed view of a ``pub_var`` node."""
+
+    __slots__ = ()
+    KIND_ID = PUB_VAR
+
+    @property
+    def variable_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_VARIABLE_IDENTIFIER)
+
+    @property
+    def natural(self) -> Optional["Node"]:
+        return self._child_of_kind(NATURAL)
+
+
+class FreshVar(NodeWrapper):
+    """Typed view of a ``fresh_var`` node."""
+
+    __slots__ = ()
+    KIND_ID = FRESH_VAR
+
+    @property
+    def variable_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_VARIABLE_IDENTIFIER)
+
+    @property
+    def natural(self) -> Optional["Node"]:
+        return self._child_of_kind(NATURAL)
+
+
+class MsgVarOrNullaryFun(NodeWrapper):
+    """Typed view of a ``msg_var_or_nullary_fun`` node."""
+
+    __slots__ = ()
+    KIND_ID = MSG_VAR_OR_NULLARY_FUN
+
+    @property
+    def variable_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_VARIABLE_IDENTIFIER)
+
+    @property
+    def natural(self) -> Optional["Node"]:
+        return self._child_of_kind(NATURAL)
+
+
+class TemporalVar(NodeWrapper):
+    """Typed view of a ``temporal_var`` node."""
+
+    __slots__ = ()
+    KIND_ID = TEMPORAL_VAR
+
+    @property
+    def variable_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_VARIABLE_IDENTIFIER)
+
+    @property
+    def natural(self) -> Optional["Node"]:
+        return self._child_of_kind(NATURAL)
+
+
+class NatVar(NodeWrapper):
+    """Typed view of a ``nat_var`` node."""
+
+    __slots__ = ()
+    KIND_ID = NAT_VAR
+
+    @property
+    def variable_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_VARIABLE_IDENTIFIER)
+
+    @property
+    def natural(self) -> Optional["Node"]:
+        return self._child_of_kind(NATURAL)
+
+
+class CompVar(NodeWrapper):
+    """Typed view of a ``comp_var`` node."""
+
+    __slots__ = ()
+    KIND_ID = COMP_VAR
+
+    @property
+    def any_var(self) -> Optional["Node"]:
+        return self._child_of_kind(ANY_VAR)
+
+    @property
+    def comp_var(self) -> Optional["Node"]:
+        return self._child_of_kind(COMP_VAR)
+
+    @property
+    def custom_var(self) -> Optional["Node"]:
+        return self._child_of_kind(CUSTOM_VAR)
+
+    @property
+    def fresh_name(self) -> Optional["Node"]:
+        return self._child_of_kind(FRESH_NAME)
+
+    @property
+    def fresh_var(self) -> Optional["Node"]:
+        return self._child_of_kind(FRESH_VAR)
+
+    @property
+    def msg_var_or_nullary_fun(self) -> Optional["Node"]:
+        return self._child_of_kind(MSG_VAR_OR_NULLARY_FUN)
+
+    @property
+    def nat_var(self) -> Optional["Node"]:
+        return self._child_of_kind(NAT_VAR)
+
+    @property
+    def pub_name(self) -> Optional["Node"]:
+        return self._child_of_kind(PUB_NAME)
+
+    @property
+    def pub_var(self) -> Optional["Node"]:
+        return self._child_of_kind(PUB_VAR)
+
+
+class CustomVar(NodeWrapper):
+    """Typed view of a ``custom_var`` node."""
+
+    __slots__ = ()
+    KIND_ID = CUSTOM_VAR
+
+    @property
+    def variable_type(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_VARIABLE_TYPE)
+
+    @property
+    def any_var(self) -> Optional["Node"]:
+        return self._child_of_kind(ANY_VAR)
+
+    @property
+    def comp_var(self) -> Optional["Node"]:
+        return self._child_of_kind(COMP_VAR)
+
+    @property
+    def custom_var(self) -> Optional["Node"]:
+        return self._child_of_kind(CUSTOM_VAR)
+
+    @property
+    def fresh_name(self) -> Optional["Node"]:
+        return self._child_of_kind(FRESH_NAME)
+
+    @property
+    def fresh_var(self) -> Optional["Node"]:
+        return self._child_of_kind(FRESH_VAR)
+
+    @property
+    def msg_var_or_nullary_fun(self) -> Optional["Node"]:
+        return self._child_of_kind(MSG_VAR_OR_NULLARY_FUN)
+
+    @property
+    def nat_var(self) -> Optional["Node"]:
+        return self._child_of_kind(NAT_VAR)
+
+    @property
+    def pub_name(self) -> Optional["Node"]:
+        return self._child_of_kind(PUB_NAME)
+
+    @property
+    def pub_var(self) -> Optional["Node"]:
+        return self._child_of_kind(PUB_VAR)
+
+
+class AnyVar(NodeWrapper):
+    """Typed view of a ``any_var`` node."""
+
+    __slots__ = ()
+    KIND_ID = ANY_VAR
+
+    @property
+    def any_var(self) -> Optional["Node"]:
+        return self._child_of_kind(ANY_VAR)
+
+    @property
+    def comp_var(self) -> Optional["Node"]:
+        return self._child_of_kind(COMP_VAR)
+
+    @property
+    def custom_var(self) -> Optional["Node"]:
+        return self._child_of_kind(CUSTOM_VAR)
+
+    @property
+    def fresh_name(self) -> Optional["Node"]:
+        return self._child_of_kind(FRESH_NAME)
+
+    @property
+    def fresh_var(self) -> Optional["Node"]:
+        return self._child_of_kind(FRESH_VAR)
+
+    @property
+    def msg_var_or_nullary_fun(self) -> Optional["Node"]:
+        return self._child_of_kind(MSG_VAR_OR_NULLARY_FUN)
+
+    @property
+    def nat_var(self) -> Optional["Node"]:
+        return self._child_of_kind(NAT_VAR)
+
+    @property
+    def pub_name(self) -> Optional["Node"]:
+        return self._child_of_kind(PUB_NAME)
+
+    @property
+    def pub_var(self) -> Optional["Node"]:
+        return self._child_of_kind(PUB_VAR)
+
+
+class PubName(NodeWrapper):
+    """Typed view of a ``pub_name`` node."""
+
+    __slots__ = ()
+    KIND_ID = PUB_NAME
+
+
+class FreshName(NodeWrapper):
+    """Typed view of a ``fresh_name`` node."""
+
+    __slots__ = ()
+    KIND_ID = FRESH_NAME
+
+
+class Iff(NodeWrapper):
+    """Typed view of a ``iff`` node."""
+
+    __slots__ = ()
+    KIND_ID = IFF
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RIGHT)
+
+
+class Imp(NodeWrapper):
+    """Typed view of a ``imp`` node."""
+
+    __slots__ = ()
+    KIND_ID = IMP
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RIGHT)
+
+
+class Disjunction(NodeWrapper):
+    """Typed view of a ``disjunction`` node."""
+
+    __slots__ = ()
+    KIND_ID = DISJUNCTION
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RIGHT)
+
+
+class Conjunction(NodeWrapper):
+    """Typed view of a ``conjunction`` node."""
+
+    __slots__ = ()
+    KIND_ID = CONJUNCTION
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RIGHT)
+
+
+class Negation(NodeWrapper):
+    """Typed view of a ``negation`` node."""
+
+    __slots__ = ()
+    KIND_ID = NEGATION
+
+    @property
+    def formula(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FORMULA)
+
+
+class NestedFormula(NodeWrapper):
+    """Typed view of a ``nested_formula`` node."""
+
+    __slots__ = ()
+    KIND_ID = NESTED_FORMULA
+
+    @property
+    def action_constraint(self) -> Optional["Node"]:
+        return self._child_of_kind(ACTION_CONSTRAINT)
+
+    @property
+    def atom(self) -> Optional["Node"]:
+        return self._child_of_kind(ATOM)
+
+    @property
+    def conjunction(self) -> Optional["Node"]:
+        return self._child_of_kind(CONJUNCTION)
+
+    @property
+    def disjunction(self) -> Optional["Node"]:
+        return self._child_of_kind(DISJUNCTION)
+
+    @property
+    def iff(self) -> Optional["Node"]:
+        return self._child_of_kind(IFF)
+
+    @property
+    def imp(self) -> Optional["Node"]:
+        return self._child_of_kind(IMP)
+
+    @property
+    def negation(self) -> Optional["Node"]:
+        return self._child_of_kind(NEGATION)
+
+    @property
+    def nested_formula(self) -> Optional["Node"]:
+        return self._child_of_kind(NESTED_FORMULA)
+
+    @property
+    def pre_defined(self) -> Optional["Node"]:
+        return self._child_of_kind(PRE_DEFINED)
+
+    @property
+    def predicate_ref(self) -> Optional["Node"]:
+        return self._child_of_kind(PREDICATE_REF)
+
+    @property
+    def quantified_formula(self) -> Optional["Node"]:
+        return self._child_of_kind(QUANTIFIED_FORMULA)
+
+    @property
+    def subterm_rel(self) -> Optional["Node"]:
+        return self._child_of_kind(SUBTERM_REL)
+
+    @property
+    def temp_var_eq(self) -> Optional["Node"]:
+        return self._child_of_kind(TEMP_VAR_EQ)
+
+    @property
+    def temp_var_induction(self) -> Optional["Node"]:
+        return self._child_of_kind(TEMP_VAR_INDUCTION)
+
+    @property
+    def temp_var_order(self) -> Optional["Node"]:
+        return self._child_of_kind(TEMP_VAR_ORDER)
+
+    @property
+    def term_eq(self) -> Optional["Node"]:
+        return self._child_of_kind(TERM_EQ)
+
+
+class TempVarInduction(NodeWrapper):
+    """Typed view of a ``temp_var_induction`` node."""
+
+    __slots__ = ()
+    KIND_ID = TEMP_VAR_INDUCTION
+
+    @property
+    def temporal_var(self) -> Optional["Node"]:
+        return self._child_of_kind(TEMPORAL_VAR)
+
+
+class TempVarOrder(NodeWrapper):
+    """Typed view of a ``temp_var_order`` node."""
+
+    __slots__ = ()
+    KIND_ID = TEMP_VAR_ORDER
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RIGHT)
+
+
+class TempVarEq(NodeWrapper):
+    """Typed view of a ``temp_var_eq`` node."""
+
+    __slots__ = ()
+    KIND_ID = TEMP_VAR_EQ
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RIGHT)
+
+
+class TermEq(NodeWrapper):
+    """Typed view of a ``term_eq`` node."""
+
+    __slots__ = ()
+    KIND_ID = TERM_EQ
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RIGHT)
+
+
+class SubtermRel(NodeWrapper):
+    """Typed view of a ``subterm_rel`` node."""
+
+    __slots__ = ()
+    KIND_ID = SUBTERM_REL
+
+    @property
+    def left(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_LEFT)
+
+    @property
+    def right(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_RIGHT)
+
+
+class QuantifiedFormula(NodeWrapper):
+    """Typed view of a ``quantified_formula`` node."""
+
+    __slots__ = ()
+    KIND_ID = QUANTIFIED_FORMULA
+
+    @property
+    def formula(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FORMULA)
+
+    @property
+    def variable(self) -> List["Node"]:
+        return self.node.children_by_field_id(FIELD_VARIABLE)
+
+
+class Atom(NodeWrapper):
+    """Typed view of a ``atom`` node."""
+
+    __slots__ = ()
+    KIND_ID = ATOM
+
+
+class PredicateRef(NodeWrapper):
+    """Typed view of a ``predicate_ref`` node."""
+
+    __slots__ = ()
+    KIND_ID = PREDICATE_REF
+
+    @property
+    def predicate_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_PREDICATE_IDENTIFIER)
+
+    @property
+    def arguments(self) -> Optional["Node"]:
+        return self._child_of_kind(ARGUMENTS)
+
+
+class PreDefined(NodeWrapper):
+    """Typed view of a ``pre_defined`` node."""
+
+    __slots__ = ()
+    KIND_ID = PRE_DEFINED
+
+    @property
+    def ident(self) -> Optional["Node"]:
+        return self._child_of_kind(IDENT)
+
+
+class Hexcolor(NodeWrapper):
+    """Typed view of a ``hexcolor`` node."""
+
+    __slots__ = ()
+    KIND_ID = HEXCOLOR
+
+
+class NaturalSubscript(NodeWrapper):
+    """Typed view of a ``natural_subscript`` node."""
+
+    __slots__ = ()
+    KIND_ID = NATURAL_SUBSCRIPT
+
+
+class FormalComment(NodeWrapper):
+    """Typed view of a ``formal_comment`` node."""
+
+    __slots__ = ()
+    KIND_ID = FORMAL_COMMENT
+
+    @property
+    def comment_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_COMMENT_IDENTIFIER)
+
+
+class Path(NodeWrapper):
+    """Typed view of a ``path`` node."""
+
+    __slots__ = ()
+    KIND_ID = PATH
+
+
+class PersistentFact(NodeWrapper):
+    """Typed view of a ``persistent_fact`` node."""
+
+    __slots__ = ()
+    KIND_ID = PERSISTENT_FACT
+
+    @property
+    def fact_identifier(self) -> Optional["Node"]:
+        return self.node.child_by_field_id(FIELD_FACT_IDENTIFIER)
+
+    @property
+    def arguments(self) -> Optional["Node"]:
+        return self._child_of_kind(ARGUMENTS)
+
+    @property
+    def fact_annotes(self) -> Optional["Node"]:
+        return self._child_of_kind(FACT_ANNOTES)
+
+
+WRAPPERS: Dict[int, Type[NodeWrapper]] = {
+    IDENT: Ident,
+    STANDARD_PROOF_METHOD_RANKING: StandardProofMethodRanking,
+    NULL: Null,
+    SOLVED: Solved,
+    MIRRORED: Mirrored,
+    PARAM: Param,
+    EXPORT_QUERY: ExportQuery,
+    NATURAL: Natural,
+    MULTI_COMMENT: MultiComment,
+    SINGLE_COMMENT: SingleComment,
+    THEORY: Theory,
+    COMMANDLINE: Commandline,
+    PREPROCESSOR: Preprocessor,
+    IFDEF: Ifdef,
+    DEFINE: Define,
+    INCLUDE: Include,
+    IFDEF_NESTED: IfdefNested,
+    IFDEF_OR: IfdefOr,
+    IFDEF_AND: IfdefAnd,
+    IFDEF_NOT: IfdefNot,
+    BUILT_INS: BuiltIns,
+    BUILT_IN: BuiltIn,
+    FUNCTIONS: Functions,
+    FUNCTION_UNTYPED: FunctionUntyped,
+    FUNCTION_ATTRIBUTE: FunctionAttribute,
+    FUNCTION_TYPED: FunctionTyped,
+    EQUATIONS: Equations,
+    EQUATION: Equation,
+    PREDICATES: Predicates,
+    PREDICATE: Predicate,
+    OPTIONS: Options,
+    OPTION: Option,
+    GLOBAL_HEURISTIC: GlobalHeuristic,
+    ORACLE_PROOF_METHOD_RANKING: OracleProofMethodRanking,
+    TACTIC_PROOF_METHOD_RANKING: TacticProofMethodRanking,
+    TACTIC: Tactic,
+    PRESORT: Presort,
+    PRIO: Prio,
+    DEPRIO: Deprio,
+    POST_RANKING: PostRanking,
+    OR_FUNCTION: OrFunction,
+    AND_FUNCTION: AndFunction,
+    NOT_FUNCTION: NotFunction,
+    STD_FUNCTION: StdFunction,
+    FUNCTION_NAME: FunctionName,
+    PROCESS: Process,
+    LOCATION_PROCESS: LocationProcess,
+    INLINE_MSR_PROCESS: InlineMsrProcess,
+    PREDEFINED_PROCESS: PredefinedProcess,
+    BINDING: Binding,
+    OUTPUT: Output,
+    INPUT: Input,
+    CONDITIONAL: Conditional,
+    PROCESS_LET: ProcessLet,
+    DETERMINISTIC_CHOICE: DeterministicChoice,
+    NON_DETERMINISTIC_CHOICE: NonDeterministicChoice,
+    EVENT: Event,
+    REPLICATION: Replication,
+    SET_STATE: SetState,
+    DELETE_STATE: DeleteState,
+    READ_STATE: ReadState,
+    SET_LOCK: SetLock,
+    REMOVE_LOCK: RemoveLock,
+    EQUALITY_CHECK: EqualityCheck,
+    LESSER_CHECK: LesserCheck,
+    LET: Let,
+    EXPORT: Export,
+    RULE: Rule,
+    DIFF_RULE: DiffRule,
+    SIMPLE_RULE: SimpleRule,
+    PREMISE: Premise,
+    ACTION_FACT: ActionFact,
+    CONCLUSION: Conclusion,
+    VARIANTS: Variants,
+    MODULO: Modulo,
+    RULE_ATTRS: RuleAttrs,
+    RULE_ATTR: RuleAttr,
+    RULE_ATTR_COLOR: RuleAttrColor,
+    RULE_ROLE: RuleRole,
+    RULE_PROCESS: RuleProcess,
+    RULE_LET_BLOCK: RuleLetBlock,
+    RULE_LET_TERM: RuleLetTerm,
+    MACROS: Macros,
+    MACRO: Macro,
+    EMBEDDED_RESTRICTION: EmbeddedRestriction,
+    LINEAR_FACT: LinearFact,
+    FACT_ANNOTES: FactAnnotes,
+    FACT_ANNOTE: FactAnnote,
+    RESTRICTION: Restriction,
+    RESTRICTION_ATTR: RestrictionAttr,
+    CASE_TEST: CaseTest,
+    LEMMA: Lemma,
+    LEMMA_ATTR: LemmaAttr,
+    LANGUAGE: Language,
+    DIFF_LEMMA: DiffLemma,
+    DIFF_LEMMA_ATTRS: DiffLemmaAttrs,
+    DIFF_LEMMA_ATTR: DiffLemmaAttr,
+    ACCOUNTABILITY_LEMMA: AccountabilityLemma,
+    EQUIV_LEMMA: EquivLemma,
+    DIFF_EQUIV_LEMMA: DiffEquivLemma,
+    TRACE_QUANTIFIER: TraceQuantifier,
+    BY_METHOD: ByMethod,
+    METHOD_SKELETON: MethodSkeleton,
+    CASES: Cases,
+    CASE: Case,
+    PROOF_METHOD: ProofMethod,
+    STEP: Step,
+    CONSTRAINT: Constraint,
+    PREMISE_CONSTRAINT: PremiseConstraint,
+    ACTION_CONSTRAINT: ActionConstraint,
+    CHAIN_CONSTRAINT: ChainConstraint,
+    DISJUNCTION_SPLIT_CONSTRAINT: DisjunctionSplitConstraint,
+    EQ_SPLIT_CONSTRAINT: EqSplitConstraint,
+    TUPLE_TERM: TupleTerm,
+    MSET_TERM: MsetTerm,
+    NAT_TERM: NatTerm,
+    XOR_TERM: XorTerm,
+    MUL_TERM: MulTerm,
+    EXP_TERM: ExpTerm,
+    NESTED_TERM: NestedTerm,
+    NULLARY_FUN: NullaryFun,
+    BINARY_APP: BinaryApp,
+    NARY_APP: NaryApp,
+    ARGUMENTS: Arguments,
+    PUB_VAR: PubVar,
+    FRESH_VAR: FreshVar,
+    MSG_VAR_OR_NULLARY_FUN: MsgVarOrNullaryFun,
+    TEMPORAL_VAR: TemporalVar,
+    NAT_VAR: NatVar,
+    COMP_VAR: CompVar,
+    CUSTOM_VAR: CustomVar,
+    ANY_VAR: AnyVar,
+    PUB_NAME: PubName,
+    FRESH_NAME: FreshName,
+    IFF: Iff,
+    IMP: Imp,
+    DISJUNCTION: Disjunction,
+    CONJUNCTION: Conjunction,
+    NEGATION: Negation,
+    NESTED_FORMULA: NestedFormula,
+    TEMP_VAR_INDUCTION: TempVarInduction,
+    TEMP_VAR_ORDER: TempVarOrder,
+    TEMP_VAR_EQ: TempVarEq,
+    TERM_EQ: TermEq,
+    SUBTERM_REL: SubtermRel,
+    QUANTIFIED_FORMULA: QuantifiedFormula,
+    ATOM: Atom,
+    PREDICATE_REF: PredicateRef,
+    PRE_DEFINED: PreDefined,
+    HEXCOLOR: Hexcolor,
+    NATURAL_SUBSCRIPT: NaturalSubscript,
+    FORMAL_COMMENT: FormalComment,
+    PATH: Path,
+    PERSISTENT_FACT: PersistentFact,
+}
+
+
+def wrap(node: "Node") -> NodeWrapper:
+    """Get the typed wrapper of a node."""
+    return WRAPPERS.get(node.kind_id, NodeWrapper)(node)
@@ -0,0 +1,220 @@
+"""Position index converting between byte, point, UTF-16 and code point offsets.
+
+Tree-sitter reports byte offsets and ``(row, byte column)`` points while the
+Language Server Protocol counts columns in UTF-16 code units. A
+:class:`PositionIndex` converts between all of them in ``O(log n)``. Rows are
+delimited by ``\\n`` only, as in tree-sitter.
+"""
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from tree_sitter import Node
+
+Point = Tuple[int, int]
+
+# Anchors of a line without any non-ASCII character.
+_ASCII = None
+
+
+def _scan_line(line: bytes) -> Tuple[int, Optional[Tuple[List[int], ...]]]:
+    """Get the code point length and the anchors of a line.
+
+    Anchors are three parallel lists of byte, UTF-16 and code point columns.
+    Entry 0 is the line start, then every non-ASCII character adds one anchor
+    at its start (odd index) and one at its end (even index). Between an even
+    anchor and the next one all characters are ASCII.
+    """
+    if line.isascii():
+        return len(line), _ASCII
+
+    byte_cols, utf16_cols, char_cols = [0], [0], [0]
+    byte_col = utf16_col = char_col = 0
+    for char in line.decode("utf-8", "surrogateescape"):
+        code = ord(char)
+        if code < 0x80:
+            byte_col += 1
+            utf16_col += 1
+            char_col += 1
+            continue
+        byte_cols.append(byte_col)
+        utf16_cols.append(utf16_col)
+        char_cols.append(char_col)
+        if 0xDC80 <= code <= 0xDCFF:
+            # Undecodable byte, counted as a single character
+            byte_col += 1
+        else:
+            byte_col += 2 if code < 0x800 else 3 if code < 0x10000 else 4
+        utf16_col += 2 if code >= 0x10000 else 1
+        char_col += 1
+        byte_cols.append(byte_col)
+        utf16_cols.append(utf16_col)
+        char_cols.append(char_col)
+    return char_col, (byte_cols, utf16_cols, char_cols)
+
+
+def _convert(anchors, source: int, target: int, column: int) -> int:
+    if anchors is _ASCII:
+        return column
+    i = bisect_right(anchors[source], column) - 1
+    if i % 2:
+        # Inside a multi-unit character, snap to its start
+        return anchors[target][i]
+    return anchors[target][i] + column - anchors[source][i]
+
+
+_BYTES, _UTF16, _CHARS = 0, 1, 2
+
+
+class PositionIndex:
+    """Offset conversions for one document.
+
+    Keep the index in sync with the parse tree by routing edits through
+    :meth:`edit`, which returns the arguments expected by ``Tree.edit``.
+    """
+
+    __slots__ = ("source", "_line_bytes", "_line_chars", "_anchors", "_char_count")
+
+    def __init__(self, source: bytes):
+        self.source = source
+        self._line_bytes: List[int] = []
+        self._line_chars: List[int] = []
+        self._anchors: List[Optional[Tuple[List[int], ...]]] = []
+        self._char_count = self._scan(source, 0, 0)
+
+    def _scan(self, text: bytes, byte_start: int, char_start: int) -> int:
+        """Append the lines of ``text`` and return the code point end offset."""
+        for line in text.split(b"\n"):
+            length, anchors = _scan_line(line)
+            self._line_bytes.append(byte_start)
+            self._line_chars.append(char_start)
+            self._anchors.append(anchors)
+            byte_start += len(line) + 1
+            char_start += length + 1
+        return char_start - 1
+
+    @property
+    def line_count(self) -> int:
+        return len(self._line_bytes)
+
+    @property
+    def char_count(self) -> int:
+        return self._char_count
+
+    def _row(self, offset: int) -> int:
+        return bisect_right(self._line_bytes, offset) - 1
+
+    def _line_end(self, row: int) -> int:
+        if row + 1 < len(self._line_bytes):
+            return self._line_bytes[row + 1] - 1
+        return len(self.source)
+
+    def _clamp_row(self, row: int) -> int:
+        return min(max(row, 0), len(self._line_bytes) - 1)
+
+    def byte_to_point(self, offset: int) -> Point:
+        """Convert a byte offset to a tree-sitter ``(row, byte column)``."""
+        offset = min(max(offset, 0), len(self.source))
+        row = self._row(offset)
+        return row, offset - self._line_bytes[row]
+
+    def point_to_byte(self, point: Point) -> int:
+        """Convert a tree-sitter ``(row, byte column)`` to a byte offset."""
+        row = self._clamp_row(point[0])
+        start = self._line_bytes[row]
+        return min(start + max(point[1], 0), self._line_end(row))
+
+    def byte_to_utf16(self, offset: int) -> Point:
+        """Convert a byte offset to an LSP ``(line, character)``."""
+        row, column = self.byte_to_point(offset)
+        return row, _convert(self._anchors[row], _BYTES, _UTF16, column)
+
+    def utf16_to_byte(self, position: Point) -> int:
+        """Convert an LSP ``(line, character)`` to a byte offset."""
+        row = self._clamp_row(position[0])
+        column = _convert(self._anchors[row], _UTF16, _BYTES, max(position[1], 0))
+        return min(self._line_bytes[row] + column, self._line_end(row))
+
+    def point_to_utf16(self, point: Point) -> Point:
+        """Convert a tree-sitter point to an LSP position."""
+        return self.byte_to_utf16(self.point_to_byte(point))
+
+    def utf16_to_point(self, position: Point) -> Point:
+        """Convert an LSP position to a tree-sitter point."""
+        return self.byte_to_point(self.utf16_to_byte(position))
+
+    def byte_to_char(self, offset: int) -> int:
+        """Convert a byte offset to a code point offset, as used by ``str``."""
+        row, column = self.byte_to_point(offset)
+        return self._line_chars[row] + _convert(
+            self._anchors[row], _BYTES, _CHARS, column
+        )
+
+    def char_to_byte(self, offset: int) -> int:
+        """Convert a code point offset to a byte offset."""
+        offset = min(max(offset, 0), self._char_count)
+        row = bisect_right(self._line_chars, offset) - 1
+        column = offset - self._line_chars[row]
+        return self._line_bytes[row] + _convert(
+            self._anchors[row], _CHARS, _BYTES, column
+        )
+
+    def utf16_range(self, start_byte: int, end_byte: int) -> Tuple[Point, Point]:
+        """Convert a byte span, e.g. from ``TermDAG.occurrences``, to an LSP range."""
+        return self.byte_to_utf16(start_byte), self.byte_to_utf16(end_byte)
+
+    def node_utf16_range(self, node: "Node") -> Tuple[Point, Point]:
+        """Get the LSP range of a syntax tree node."""
+        return self.utf16_range(node.start_byte, node.end_byte)
+
+    def edit(
+        self, start_byte: int, old_end_byte: int, new_text: bytes
+    ) -> Dict[str, object]:
+        """Replace ``source[start_byte:old_end_byte]`` with ``new_text``.
+
+        Only the lines touched by the edit are rescanned. Returns the keyword
+        arguments of the matching ``Tree.edit`` call.
+        """
+        start_byte = min(max(start_byte, 0), len(self.source))
+        old_end_byte = min(max(old_end_byte, start_byte), len(self.source))
+        new_end_byte = start_byte + len(new_text)
+        start_point = self.byte_to_point(start_byte)
+        old_end_point = self.byte_to_point(old_end_byte)
+
+        first_row, last_row = start_point[0], old_end_point[0]
+        old_lines_end = self._line_end(last_row)
+        old_chars = (
+            self._line_chars[last_row + 1] - 1
+            if last_row + 1 < len(self._line_chars)
+            else self._char_count
+        ) - self._line_chars[first_row]
+
+        self.source = self.source[:start_byte] + new_text + self.source[old_end_byte:]
+        delta = len(new_text) - (old_end_byte - start_byte)
+        region_start = self._line_bytes[first_row]
+        region = self.source[region_start : old_lines_end + delta]
+
+        tail_bytes = self._line_bytes[last_row + 1 :]
+        tail_chars = self._line_chars[last_row + 1 :]
+        tail_anchors = self._anchors[last_row + 1 :]
+        char_start = self._line_chars[first_row]
+        del self._line_bytes[first_row:]
+        del self._line_chars[first_row:]
+        del self._anchors[first_row:]
+        new_chars = self._scan(region, region_start, char_start) - char_start
+
+        char_delta = new_chars - old_chars
+        self._line_bytes.extend(offset + delta for offset in tail_bytes)
+        self._line_chars.extend(offset + char_delta for offset in tail_chars)
+        self._anchors.extend(tail_anchors)
+        self._char_count += char_delta
+
+        return {
+            "start_byte": start_byte,
+            "old_end_byte": old_end_byte,
+            "new_end_byte": new_end_byte,
+            "start_point": start_point,
+            "old_end_point": old_end_point,
+            "new_end_point": self.byte_to_point(new_end_byte),
+        }
@@ -0,0 +1,315 @@
+"""Hash-consed term DAG extraction for Spthy theories.
+
+Every distinct term found in rules, restrictions, lemmas and equations is stored
+once and identified by a small integer id, so two occurrences of ``pk(~ltk)``
+compare equal with a plain ``==`` on their ids.
+
+Terms are stored the way Tamarin reads them: tuples are right-nested pairs,
+``^`` is a binary ``exp`` in the grammar's right associativity, and variables
+are identified by their name and sort, not by how the sort is written. The
+associative operators ``++``, ``%+``, ``XOR`` and ``*`` are flattened through
+parentheses, but their operands keep the source order, so terms that are only
+equal modulo commutativity get different ids.
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from tree_sitter import Node, Tree
+
+# Associative precedence levels of the grammar. A level with a single operand
+# is only a wrapper and is collapsed onto that operand.
+_OPERATORS = {
+    "mset_term": "mset",
+    "nat_term": "nat_plus",
+    "xor_term": "xor",
+    "mul_term": "mul",
+}
+
+# ``f(a, b)``, ``f{a}b`` and nullary ``f`` all denote function applications.
+# ``f{a, b}k`` is ``f(<a, b>, k)``.
+_APPLICATIONS = frozenset({"nary_app", "binary_app", "nullary_fun"})
+
+# Variables that can appear outside of a term, e.g. quantified variables or
+# the timepoint of an action constraint.
+_VARIABLES = frozenset(
+    {
+        "fresh_var",
+        "pub_var",
+        "nat_var",
+        "msg_var_or_nullary_fun",
+        "temporal_var",
+    }
+)
+
+# Sort prefixes used when rendering variables.
+_SORT_PREFIXES = {
+    "fresh_var": "~",
+    "pub_var": "$",
+    "nat_var": "%",
+    "temporal_var": "#",
+}
+
+_INFIX = {
+    "mset": " ++ ",
+    "nat_plus": " %+ ",
+    "xor": " XOR ",
+    "mul": " * ",
+    "exp": " ^ ",
+}
+
+TERM_SCOPES = frozenset(
+    {
+        "simple_rule",
+        "restriction",
+        "lemma",
+        "accountability_lemma",
+        "equation",
+    }
+)
+
+_Key = Tuple[str, str, Tuple[int, ...]]
+
+
+class Term:
+    """A single node of a :class:`TermDAG`."""
+
+    __slots__ = ("id", "kind", "label", "args")
+
+    def __init__(self, id: int, kind: str, label: str, args: Tuple[int, ...]):
+        self.id = id
+        self.kind = kind
+        self.label = label
+        self.args = args
+
+    def __repr__(self) -> str:
+        return (
+            f"Term(id={self.id}, kind={self.kind!r}, "
+            f"label={self.label!r}, args={self.args})"
+        )
+
+
+class TermDAG:
+    """Hash-consed store of the terms of one or more parse trees.
+
+    ``terms[i]`` is the term with id ``i`` and ``spans[i]`` lists the
+    ``(start_byte, end_byte)`` of every occurrence of it in the source.
+    """
+
+    __slots__ = ("terms", "spans", "_index")
+
+    def __init__(self):
+        self.terms: List[Term] = []
+        self.spans: List[List[Tuple[int, int]]] = []
+        self._index: Dict[_Key, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __getitem__(self, term_id: int) -> Term:
+        return self.terms[term_id]
+
+    def occurrences(self, term_id: int) -> List[Tuple[int, int]]:
+        """Get the source spans of every occurrence of a term."""
+        return self.spans[term_id]
+
+    def lookup(
+        self, kind: str, label: str, args: Tuple[int, ...] = ()
+    ) -> Optional[int]:
+        """Get the id of a term if it is already in the DAG."""
+        return self._index.get((kind, label, args))
+
+    def add(self, kind: str, label: str, args: Tuple[int, ...] = ()) -> int:
+        """Get the id of a term, adding it to the DAG if needed."""
+        key = (kind, label, args)
+        term_id = self._index.get(key)
+        if term_id is None:
+            term_id = len(self.terms)
+            self._index[key] = term_id
+            self.terms.append(Term(term_id, kind, label, args))
+            self.spans.append([])
+        return term_id
+
+    def add_node(self, node: "Node") -> int:
+        """Convert a term node of the syntax tree and return its id."""
+        # Every level of a term nests five precedence wrappers, so convert with
+        # an explicit stack rather than recursion to support deep terms.
+        ids: List[int] = []
+        stack: List[Tuple["Node", Optional[List["Node"]]]] = [(node, None)]
+        while stack:
+            node, operands = stack.pop()
+            if operands is None:
+                operands = _subterms(node)
+                if operands is None:
+                    ids.append(self._add_leaf(node))
+                else:
+                    stack.append((node, operands))
+                    stack.extend((c, None) for c in reversed(operands))
+            else:
+                start = len(ids) - len(operands)
+                args = ids[start:]
+                del ids[start:]
+                ids.append(self._add_compound(node, operands, args))
+        return ids[0]
+
+    def _add_leaf(self, node: "Node") -> int:
+        node_type = node.type
+        if node.child_by_field_name("variable_identifier") is not None:
+            # ``#i``, ``i`` and ``i:node`` name the same timepoint.
+            label = _variable_name(node)
+        else:
+            # Quoted names keep their whitespace, 'a b' is not 'ab'.
+            label = node.text.decode("utf-8")
+        term_id = self.add(node_type, label)
+        self.spans[term_id].append((node.start_byte, node.end_byte))
+        return term_id
+
+    def _add_compound(
+        self, node: "Node", operands: List["Node"], args: List[int]
+    ) -> int:
+        """Add a node whose subterms have already been added as ``args``."""
+        node_type = node.type
+        if node_type in _APPLICATIONS:
+            # For ``f{a, b}k`` the arguments are already ``(<a, b>, k)``.
+            label = _compact(node.child_by_field_name("function_identifier").text)
+            term_id = self.add("app", label, tuple(args))
+        elif len(args) == 1:
+            # Precedence wrappers, parentheses and one-element braces
+            return args[0]
+        elif node_type == "exp_term":
+            # g^a^b is g^(a^b)
+            return self._add_chain("exp", node, operands, args)
+        elif node_type in ("tuple_term", "arguments"):
+            # <a, b, c> is <a, <b, c>>
+            return self._add_chain("tuple", node, operands, args)
+        else:
+            kind = _OPERATORS[node_type]
+            flat: List[int] = []
+            for arg in args:
+                # (a XOR b) XOR c is a XOR b XOR c
+                if self.terms[arg].kind == kind:
+                    flat.extend(self.terms[arg].args)
+                else:
+                    flat.append(arg)
+            term_id = self.add(kind, "", tuple(flat))
+        self.spans[term_id].append((node.start_byte, node.end_byte))
+        return term_id
+
+    def _add_chain(
+        self, kind: str, node: "Node", operands: List["Node"], args: List[int]
+    ) -> int:
+        """Fold operands into right-nested binary terms of one kind."""
+        term_id = args[-1]
+        for i in range(len(args) - 2, -1, -1):
+            term_id = self.add(kind, "", (args[i], term_id))
+            # The outermost term spans the whole node, e.g. with its brackets
+            start = operands[i].start_byte if i else node.start_byte
+            end = operands[-1].end_byte if i else node.end_byte
+            self.spans[term_id].append((start, end))
+        return term_id
+
+    def add_tree(self, tree: "Tree", scopes: Iterable[str] = TERM_SCOPES) -> List[int]:
+        """Add every term found below the given node types of a tree.
+
+        Returns the ids of the outermost terms in document order.
+        """
+        scopes = frozenset(scopes)
+        roots = []
+        stack = [(tree.root_node, False)]
+        while stack:
+            node, in_scope = stack.pop()
+            in_scope = in_scope or node.type in scopes
+            if in_scope and (node.type == "mset_term" or node.type in _VARIABLES):
+                roots.append(self.add_node(node))
+                continue
+            stack.extend((c, in_scope) for c in reversed(node.named_children))
+        return roots
+
+    def format(self, term_id: int) -> str:
+        """Render a term back to Spthy syntax."""
+        # Post-order over the DAG with an explicit stack, like add_node
+        rendered: Dict[int, str] = {}
+        stack = [term_id]
+        while stack:
+            term = self.terms[stack[-1]]
+            if term.id in rendered:
+                # Shared subterms can be pushed more than once
+                stack.pop()
+                continue
+            missing = [a for a in term.args if a not in rendered]
+            if missing:
+                stack.extend(missing)
+                continue
+            stack.pop()
+            args = [rendered[a] for a in term.args]
+            if term.kind == "app":
+                text = f"{term.label}({', '.join(args)})" if args else term.label
+            elif term.kind == "tuple":
+                # Render <a, <b, c>> as <a, b, c>, which Tamarin reads the same
+                if self.terms[term.args[1]].kind == "tuple":
+                    text = f"<{args[0]}, {args[1][1:]}"
+                else:
+                    text = f"<{args[0]}, {args[1]}>"
+            elif term.kind in _INFIX:
+                text = "(" + _INFIX[term.kind].join(args) + ")"
+            else:
+                text = _SORT_PREFIXES.get(term.kind, "") + term.label
+            rendered[term.id] = text
+        return rendered[term_id]
+
+
+def extract_term_dag(tree: "Tree", scopes: Iterable[str] = TERM_SCOPES) -> TermDAG:
+    """Build the term DAG of all rules, restrictions, lemmas and equations."""
+    dag = TermDAG()
+    dag.add_tree(tree, scopes)
+    return dag
+
+
+def _compact(text: bytes) -> str:
+    """Remove whitespace, only for identifiers where the grammar allows it."""
+    return "".join(text.decode("utf-8").split())
+
+
+def _variable_name(node: "Node") -> str:
+    """Get the name of a variable without its sort, e.g. ``x.1`` for ``~x.1``."""
+    name = node.child_by_field_name("variable_identifier").text.decode("utf-8")
+    for child in node.named_children:
+        if child.type == "natural":
+            return f"{name}.{child.text.decode('utf-8')}"
+    return name
+
+
+def _subterms(node: "Node") -> Optional[List["Node"]]:
+    """Get the subterms of a compound term node, or None for a leaf."""
+    node_type = node.type
+    if node_type in _OPERATORS or node_type in ("exp_term", "tuple_term"):
+        return _operands(node)
+    if node_type == "nested_term":
+        return [_first_term(node)]
+    if node_type == "binary_app":
+        # The braced ``arguments`` node becomes a tuple
+        return node.children_by_field_name("argument")
+    if node_type in _APPLICATIONS:
+        return _arguments(node)
+    if node_type == "arguments":
+        return _operands(node)
+    return None
+
+
+def _operands(node: "Node") -> List["Node"]:
+    return [c for c in node.named_children if not c.is_extra]
+
+
+def _first_term(node: "Node") -> "Node":
+    for child in node.named_children:
+        if not child.is_extra:
+            return child
+    raise ValueError(f"Empty {node.type} at byte {node.start_byte}")
+
+
+def _arguments(node: "Node") -> List["Node"]:
+    args = []
+    for child in node.named_children:
+        if child.type == "arguments":
+            args.extend(c for c in child.named_children if not c.is_extra)
+    return args
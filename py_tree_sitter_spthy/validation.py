@@ -0,0 +1,533 @@
+"""Theory-level semantic checks run during a single shared tree walk.
+
+A check registers interest in node kinds by defining ``visit_<kind>`` methods,
+e.g. ``visit_simple_rule``. The :class:`Validator` walks the tree once with a
+cursor and calls, for every node, only the methods registered for its kind.
+Checks that need the whole theory report their findings from ``finish``.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from . import node_types
+
+if TYPE_CHECKING:
+    from tree_sitter import Node, Tree
+
+ERROR = "error"
+WARNING = "warning"
+
+_KIND_IDS = {name: kind_id for kind_id, name in node_types.KIND_NAMES.items()}
+
+# Functions provided by each ``builtins:`` entry, with their arity.
+_BUILTIN_FUNCTIONS = {
+    "hashing": {"h": 1},
+    "asymmetric-encryption": {"aenc": 2, "adec": 2, "pk": 1},
+    "dest-asymmetric-encryption": {"aenc": 2, "adec": 2, "pk": 1},
+    "symmetric-encryption": {"senc": 2, "sdec": 2},
+    "dest-symmetric-encryption": {"senc": 2, "sdec": 2},
+    "signing": {"sign": 2, "verify": 3, "pk": 1, "true": 0},
+    "dest-signing": {"sign": 2, "verify": 3, "pk": 1, "true": 0},
+    "revealing-signing": {
+        "revealSign": 2,
+        "revealVerify": 3,
+        "getMessage": 1,
+        "pk": 1,
+        "true": 0,
+    },
+    "diffie-hellman": {"inv": 1, "one": 0, "DH_neutral": 0},
+    "bilinear-pairing": {"pmult": 2, "em": 2, "inv": 1, "one": 0, "DH_neutral": 0},
+    "xor": {"zero": 0},
+    "locations-report": {"report": 1, "check_rep": 2, "get_rep": 1},
+}
+
+# Functions available in every theory.
+_DEFAULT_FUNCTIONS = {"pair": 2, "fst": 1, "snd": 1, "diff": 2}
+
+# Facts produced by the system rather than by a rule.
+_BUILTIN_PREMISES = frozenset({"Fr", "In"})
+
+# Action facts of the adversary that lemmas may refer to.
+_BUILTIN_ACTIONS = frozenset({"K", "KU", "KD"})
+
+_FACTS = frozenset({node_types.LINEAR_FACT, node_types.PERSISTENT_FACT})
+
+_NAME_FIELDS = (
+    node_types.FIELD_LEMMA_IDENTIFIER,
+    node_types.FIELD_TEST_IDENTIFIER,
+    node_types.FIELD_RESTRICTION_IDENTIFIER,
+)
+
+_FactKey = Tuple[str, int]
+
+C = TypeVar("C", bound="Check")
+
+
+class Finding:
+    """A problem reported by a check."""
+
+    __slots__ = (
+        "check",
+        "severity",
+        "message",
+        "start_byte",
+        "end_byte",
+        "start_point",
+        "end_point",
+    )
+
+    def __init__(self, check: str, severity: str, message: str, node: "Node"):
+        self.check = check
+        self.severity = severity
+        self.message = message
+        self.start_byte = node.start_byte
+        self.end_byte = node.end_byte
+        self.start_point = tuple(node.start_point)
+        self.end_point = tuple(node.end_point)
+
+    def __repr__(self) -> str:
+        return (
+            f"Finding({self.check!r}, {self.severity!r}, {self.message!r}, "
+            f"start_point={self.start_point})"
+        )
+
+
+class ValidationContext:
+    """State shared by all checks of one validation run."""
+
+    __slots__ = ("tree", "findings", "_required")
+
+    def __init__(self, tree: "Tree"):
+        self.tree = tree
+        self.findings: List[Finding] = []
+        self._required: Dict[Type["Check"], "Check"] = {}
+
+    def check(self, check: Type["C"]) -> "C":
+        """Get the shared instance of a check listed in ``requires``."""
+        return self._required[check]  # type: ignore[return-value]
+
+    def report(
+        self, check: "Check", node: "Node", message: str, severity: str = WARNING
+    ):
+        self.findings.append(Finding(check.name, severity, message, node))
+
+
+class Check:
+    """Base class of the checks run by a :class:`Validator`.
+
+    Subclasses define ``visit_<kind>(node, context)`` for every node kind they
+    need and may override :meth:`finish`. A new instance is created for every
+    validation run, so checks can keep their state in attributes.
+
+    Checks listed in ``requires`` run once per validation however many checks
+    require them or list them, before the checks requiring them, and are
+    available from :meth:`ValidationContext.check`.
+    """
+
+    name = ""
+    requires: Tuple[Type["Check"], ...] = ()
+    _handlers: Tuple[Tuple[int, str], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        handlers = []
+        for attribute in dir(cls):
+            if not attribute.startswith("visit_"):
+                continue
+            kind = attribute[len("visit_") :]
+            if kind not in _KIND_IDS:
+                raise ValueError(f"{cls.__name__}.{attribute}: unknown node kind")
+            handlers.append((_KIND_IDS[kind], attribute))
+        cls._handlers = tuple(handlers)
+
+    def finish(self, context: ValidationContext):
+        """Report the findings that need the whole theory."""
+
+
+class Validator:
+    """Run a set of checks during one walk of the syntax tree."""
+
+    def __init__(self, checks: Optional[Iterable[Type[Check]]] = None):
+        self.checks: List[Type[Check]] = list(
+            DEFAULT_CHECKS if checks is None else checks
+        )
+
+    def register(self, check: Type[Check]) -> Type[Check]:
+        """Add a check, can be used as a class decorator."""
+        self.checks.append(check)
+        return check
+
+    def validate(self, tree: "Tree") -> List[Finding]:
+        """Run all checks on a tree and return their findings in source order."""
+        context = ValidationContext(tree)
+        checks: List[Check] = []
+        # Checks only created so far because another check requires them
+        implicit: Set[Type[Check]] = set()
+
+        def add_required(check: Type[Check]):
+            for required in check.requires:
+                if required not in context._required:
+                    add_required(required)
+                    context._required[required] = required()
+                    checks.append(context._required[required])
+                    implicit.add(required)
+
+        for check in self.checks:
+            add_required(check)
+            if check in implicit:
+                # Also listed explicitly, it still runs only once
+                implicit.discard(check)
+                continue
+            instance = check()
+            context._required.setdefault(check, instance)
+            checks.append(instance)
+
+        dispatch: Dict[int, List[Callable]] = {}
+        for check in checks:
+            for kind_id, attribute in check._handlers:
+                dispatch.setdefault(kind_id, []).append(getattr(check, attribute))
+
+        cursor = tree.walk()
+        while True:
+            node = cursor.node
+            handlers = dispatch.get(node.kind_id)
+            if handlers is not None:
+                for handler in handlers:
+                    handler(node, context)
+            if cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    break
+            else:
+                continue
+            break
+
+        for check in checks:
+            check.finish(context)
+        context.findings.sort(key=lambda finding: finding.start_byte)
+        return context.findings
+
+
+def validate(tree: "Tree") -> List[Finding]:
+    """Run the default checks on a tree."""
+    return Validator().validate(tree)
+
+
+def _text(node: Optional["Node"]) -> str:
+    return node.text.decode("utf-8") if node is not None else ""
+
+
+def _arity(node: "Node") -> int:
+    if node.kind_id == node_types.BINARY_APP:
+        # f{a, b}k is f(<a, b>, k)
+        return 2
+    for child in node.named_children:
+        if child.kind_id == node_types.ARGUMENTS:
+            return sum(1 for c in child.named_children if not c.is_extra)
+    return 0
+
+
+def _name(node: "Node") -> str:
+    for field_id in _NAME_FIELDS:
+        identifier = node.child_by_field_id(field_id)
+        if identifier is not None:
+            return _text(identifier)
+    return ""
+
+
+def _fact_key(fact: "Node") -> _FactKey:
+    return _text(fact.child_by_field_id(node_types.FIELD_FACT_IDENTIFIER)), _arity(fact)
+
+
+def _fact_name(fact: "Node", key: _FactKey) -> str:
+    prefix = "!" if fact.kind_id == node_types.PERSISTENT_FACT else ""
+    return f"{prefix}{key[0]}/{key[1]}"
+
+
+class UndeclaredFunctions(Check):
+    """Function applications must match a declaration or builtin arity.
+
+    SAPIC processes defined with ``let P(x) = ...`` are declarations too, since
+    the grammar parses both their head and their calls as function applications.
+    """
+
+    name = "undeclared-function"
+
+    def __init__(self):
+        # An arity of None is not known, e.g. while "f/" is being typed
+        self.declared: Dict[str, Optional[int]] = dict(_DEFAULT_FUNCTIONS)
+        self.processes: Dict[str, int] = {}
+        self.heads: Set[Tuple[int, int]] = set()
+        self.uses: List[Tuple["Node", str, int]] = []
+
+    def visit_built_in(self, node: "Node", context: ValidationContext):
+        self.declared.update(_BUILTIN_FUNCTIONS.get(_text(node), {}))
+
+    def visit_function_untyped(self, node: "Node", context: ValidationContext):
+        name = _text(node.child_by_field_id(node_types.FIELD_FUNCTION_IDENTIFIER))
+        arity = node.child_by_field_id(node_types.FIELD_ARITY)
+        if arity is None or arity.is_missing or arity.has_error:
+            self.declared[name] = None
+        else:
+            self.declared[name] = int(_text(arity))
+
+    def visit_function_typed(self, node: "Node", context: ValidationContext):
+        name = _text(node.child_by_field_id(node_types.FIELD_FUNCTION_IDENTIFIER))
+        self.declared[name] = _arity(node)
+
+    def visit_macro(self, node: "Node", context: ValidationContext):
+        name = node.child_by_field_id(node_types.FIELD_MACRO_IDENTIFIER)
+        term = node.child_by_field_id(node_types.FIELD_TERM)
+        self.declared[_text(name)] = sum(
+            1
+            for child in node.named_children
+            if child != name and child != term and not child.is_extra
+        )
+
+    def visit_let(self, node: "Node", context: ValidationContext):
+        head = node.child_by_field_id(node_types.FIELD_LET_IDENTIFIER)
+        if head is None:
+            return
+        self.heads.add((head.start_byte, head.end_byte))
+        while head.named_child_count == 1 and head.kind_id != node_types.NARY_APP:
+            head = head.named_children[0]
+        if head.kind_id == node_types.NARY_APP:
+            function = head.child_by_field_id(node_types.FIELD_FUNCTION_IDENTIFIER)
+            self.processes[_text(function)] = _arity(head)
+
+    def _use(self, node: "Node"):
+        if (node.start_byte, node.end_byte) in self.heads:
+            return
+        name = _text(node.child_by_field_id(node_types.FIELD_FUNCTION_IDENTIFIER))
+        self.uses.append((node, name, _arity(node)))
+
+    def visit_nary_app(self, node: "Node", context: ValidationContext):
+        self._use(node)
+
+    def visit_binary_app(self, node: "Node", context: ValidationContext):
+        self._use(node)
+
+    def visit_nullary_fun(self, node: "Node", context: ValidationContext):
+        self._use(node)
+
+    def finish(self, context: ValidationContext):
+        for node, name, arity in self.uses:
+            if name in self.declared:
+                kind, declared = "Function", self.declared[name]
+            elif name in self.processes:
+                kind, declared = "Process", self.processes[name]
+            else:
+                context.report(self, node, f"Undeclared function {name}/{arity}", ERROR)
+                continue
+            if declared is not None and declared != arity:
+                context.report(
+                    self,
+                    node,
+                    f"{kind} {name} applied to {arity} arguments "
+                    f"but declared with arity {declared}",
+                    ERROR,
+                )
+
+
+class UnproducedFacts(Check):
+    """Facts consumed by a rule must be produced by some rule."""
+
+    name = "unproduced-fact"
+
+    def __init__(self):
+        self.produced: Set[Tuple[int, _FactKey]] = set()
+        self.consumed: Dict[Tuple[int, _FactKey], "Node"] = {}
+
+    def visit_premise(self, node: "Node", context: ValidationContext):
+        for fact in node.named_children:
+            if fact.kind_id in _FACTS:
+                key = (fact.kind_id, _fact_key(fact))
+                if key[1][0] not in _BUILTIN_PREMISES:
+                    self.consumed.setdefault(key, fact)
+
+    def visit_conclusion(self, node: "Node", context: ValidationContext):
+        for fact in node.named_children:
+            if fact.kind_id in _FACTS:
+                self.produced.add((fact.kind_id, _fact_key(fact)))
+
+    def finish(self, context: ValidationContext):
+        for key, fact in self.consumed.items():
+            if key not in self.produced:
+                context.report(
+                    self,
+                    fact,
+                    f"Fact {_fact_name(fact, key[1])} is consumed but never produced",
+                )
+
+
+class EmittedActions(Check):
+    """Collects the emitted action facts and the constrained ones.
+
+    It reports nothing itself and is shared by the checks requiring it.
+    ``constraints`` holds ``(owner, fact, key)`` for every action constraint,
+    where ``owner`` is the rule, lemma, restriction or predicate containing it.
+    """
+
+    def __init__(self):
+        self.emitted: Set[_FactKey] = set()
+        self.constraints: List[Tuple["Node", "Node", _FactKey]] = []
+        self.owner: Optional["Node"] = None
+
+    def _own(self, node: "Node", context: ValidationContext):
+        self.owner = node
+
+    # Every construct containing action constraints, so that ``owner`` is
+    # never stale: the walk is in pre-order and they do not nest.
+    visit_simple_rule = _own
+    visit_lemma = _own
+    visit_accountability_lemma = _own
+    visit_case_test = _own
+    visit_restriction = _own
+    visit_predicate = _own
+
+    def visit_action_fact(self, node: "Node", context: ValidationContext):
+        for fact in node.named_children:
+            if fact.kind_id in _FACTS:
+                self.emitted.add(_fact_key(fact))
+
+    visit_event = visit_action_fact
+
+    def visit_action_constraint(self, node: "Node", context: ValidationContext):
+        fact = node.child_by_field_id(node_types.FIELD_FACT)
+        if self.owner is not None and fact is not None and fact.kind_id in _FACTS:
+            self.constraints.append((self.owner, fact, _fact_key(fact)))
+
+
+class UnemittedLemmaActions(Check):
+    """Lemmas must only refer to action facts that some rule emits."""
+
+    name = "unemitted-action"
+    requires = (EmittedActions,)
+
+    _LEMMAS = frozenset(
+        {node_types.LEMMA, node_types.ACCOUNTABILITY_LEMMA, node_types.CASE_TEST}
+    )
+
+    def finish(self, context: ValidationContext):
+        actions = context.check(EmittedActions)
+        for lemma, fact, key in actions.constraints:
+            if (
+                lemma.kind_id in self._LEMMAS
+                and key not in actions.emitted
+                and key[0] not in _BUILTIN_ACTIONS
+            ):
+                context.report(
+                    self,
+                    fact,
+                    f"Lemma {_name(lemma)} refers to action {_fact_name(fact, key)} "
+                    "which no rule emits",
+                )
+
+
+class UnusedRestrictions(Check):
+    """Restrictions must constrain at least one emitted action fact."""
+
+    name = "unused-restriction"
+    requires = (EmittedActions,)
+
+    def finish(self, context: ValidationContext):
+        actions = context.check(EmittedActions)
+        restrictions: Dict["Node", Set[_FactKey]] = {}
+        for owner, _, key in actions.constraints:
+            if owner.kind_id == node_types.RESTRICTION:
+                restrictions.setdefault(owner, set()).add(key)
+        for restriction, keys in restrictions.items():
+            if not keys & actions.emitted:
+                context.report(
+                    self,
+                    restriction,
+                    f"Restriction {_name(restriction)} only refers to actions "
+                    "no rule emits",
+                )
+
+
+class DuplicateNames(Check):
+    """Rules, lemmas and restrictions must have unique names.
+
+    Definitions inside ``#ifdef`` blocks are only compared to unconditional
+    ones, since the branches of a block usually define the same names.
+    """
+
+    name = "duplicate-name"
+
+    def __init__(self):
+        self.conditional_end = -1
+        self.nested_end = -1
+        self.names: Dict[Tuple[str, str], Tuple["Node", bool]] = {}
+
+    def _define(
+        self,
+        namespace: str,
+        node: "Node",
+        identifier: Optional["Node"],
+        context: ValidationContext,
+    ):
+        if identifier is None:
+            return
+        name = _text(identifier)
+        conditional = node.start_byte < self.conditional_end
+        previous = self.names.get((namespace, name))
+        if previous is None:
+            self.names[(namespace, name)] = (node, conditional)
+        elif not (conditional and previous[1]):
+            line = previous[0].start_point[0] + 1
+            context.report(
+                self,
+                identifier,
+                f"Duplicate {namespace} name {name}, first defined on line {line}",
+                ERROR,
+            )
+
+    def visit_ifdef(self, node: "Node", context: ValidationContext):
+        self.conditional_end = max(self.conditional_end, node.end_byte)
+
+    def visit_diff_rule(self, node: "Node", context: ValidationContext):
+        self._define_rule(node.named_children[0], context)
+        # The left and right rules repeat the name of the diff rule
+        self.nested_end = node.end_byte
+
+    def visit_rule(self, node: "Node", context: ValidationContext):
+        # Only the first simple rule is named, variants repeat its name
+        if node.start_byte >= self.nested_end:
+            self._define_rule(node.named_children[0], context)
+
+    def _define_rule(self, rule: "Node", context: ValidationContext):
+        identifier = rule.child_by_field_id(node_types.FIELD_RULE_IDENTIFIER)
+        self._define("rule", rule, identifier, context)
+
+    def _define_lemma(self, node: "Node", context: ValidationContext):
+        identifier = node.child_by_field_id(node_types.FIELD_LEMMA_IDENTIFIER)
+        self._define("lemma", node, identifier, context)
+
+    visit_lemma = _define_lemma
+    visit_diff_lemma = _define_lemma
+    visit_accountability_lemma = _define_lemma
+
+    def visit_restriction(self, node: "Node", context: ValidationContext):
+        identifier = node.child_by_field_id(node_types.FIELD_RESTRICTION_IDENTIFIER)
+        self._define("restriction", node, identifier, context)
+
+
+DEFAULT_CHECKS: Tuple[Type[Check], ...] = (
+    UndeclaredFunctions,
+    UnproducedFacts,
+    UnemittedLemmaActions,
+    UnusedRestrictions,
+    DuplicateNames,
+)
@@ -0,0 +1,348 @@
+"""Generate py_tree_sitter_spthy/node_types.py from the grammar sources.
+
+Node kinds and fields are taken from ``src/node-types.json``. Their numeric ids
+are not part of that file, so they are read from the generated ``src/parser.c``
+and resolved the same way the tree-sitter runtime does. node-types.json only
+says whether a node may have several children, not of which kind, so how often
+each kind of child can occur is counted from the rules in ``src/grammar.json``.
+
+Usage: python scripts/generate_node_types.py [--check]
+"""
+
+import json
+import keyword
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GRAMMAR_SRC = os.path.join(ROOT, "grammars", "tree-sitter-spthy", "src")
+OUTPUT = os.path.join(ROOT, "py_tree_sitter_spthy", "node_types.py")
+
+_ENUM_ENTRY = re.compile(r"^\s+(\w+) = (\d+),$", re.M)
+_NAME_ENTRY = re.compile(r'^\s+\[(\w+)\] = "((?:[^"\\]|\\.)*)",$', re.M)
+_MAP_ENTRY = re.compile(r"^\s+\[(\w+)\] = (\w+),$", re.M)
+_METADATA_ENTRY = re.compile(
+    r"^\s+\[(\w+)\] = \{\s+\.visible = (true|false),\s+\.named = (true|false),",
+    re.M,
+)
+_DEFINE = re.compile(r"^#define (\w+) (\d+)$", re.M)
+
+# Number of occurrences of a child kind that stands for "any number".
+MANY = 2
+
+
+def _block(source: str, start: str) -> str:
+    begin = source.index(start)
+    return source[begin : source.index("\n};", begin)]
+
+
+def read_parser_tables(parser_c: str) -> Tuple[Dict[str, int], Dict[str, int], Dict]:
+    """Get the public kind ids, field ids and size constants of a parser.c."""
+    with open(parser_c, "r", encoding="utf-8") as f:
+        source = f.read()
+
+    symbols = {"ts_builtin_sym_end": 0}
+    symbols.update(
+        (name, int(value))
+        for name, value in _ENUM_ENTRY.findall(
+            _block(source, "enum ts_symbol_identifiers {")
+        )
+    )
+    names = dict(_NAME_ENTRY.findall(_block(source, "ts_symbol_names[] = {")))
+    public = dict(_MAP_ENTRY.findall(_block(source, "ts_symbol_map[] = {")))
+    metadata = {
+        symbol: (visible == "true", named == "true")
+        for symbol, visible, named in _METADATA_ENTRY.findall(
+            _block(source, "ts_symbol_metadata[] = {")
+        )
+    }
+
+    # Mirrors ts_language_symbol_for_name: the first visible named symbol with
+    # a given name, mapped to its public symbol.
+    kinds: Dict[str, int] = {}
+    for symbol, symbol_id in sorted(symbols.items(), key=lambda item: item[1]):
+        visible, named = metadata.get(symbol, (False, False))
+        name = names.get(symbol)
+        if visible and named and name is not None and name not in kinds:
+            kinds[name] = symbols[public[symbol]]
+
+    fields = {
+        name[len("field_") :]: int(value)
+        for name, value in _ENUM_ENTRY.findall(
+            _block(source, "enum ts_field_identifiers {")
+        )
+    }
+    defines = {name: int(value) for name, value in _DEFINE.findall(source)}
+    return kinds, fields, defines
+
+
+def _add_counts(total: Dict[str, int], counts: Dict[str, int]):
+    for kind, count in counts.items():
+        total[kind] = min(MANY, total.get(kind, 0) + count)
+
+
+class _ChildCounter:
+    """Count the unfielded named children of the rules of a grammar.json."""
+
+    def __init__(self, grammar: Dict):
+        self.rules = grammar["rules"]
+        self.inline = set(grammar.get("inline", ()))
+        self.hidden: Dict[str, Dict[str, int]] = {}
+        self.expanding: Set[str] = set()
+        # Named aliases of visible rules, e.g. linear_fact for fact
+        self.aliases: Dict[str, Set[str]] = {}
+        for rule in self.rules.values():
+            self._find_aliases(rule)
+
+    def _find_aliases(self, rule: Dict):
+        if rule["type"] == "ALIAS" and rule["named"]:
+            content = rule["content"]
+            if content["type"] == "SYMBOL":
+                self.aliases.setdefault(rule["value"], set()).add(content["name"])
+        for member in rule.get("members", ()):
+            self._find_aliases(member)
+        if "content" in rule:
+            self._find_aliases(rule["content"])
+
+    def _is_hidden(self, name: str) -> bool:
+        return name.startswith("_") or name in self.inline
+
+    def node(self, node_type: str) -> Optional[Dict[str, int]]:
+        """Get the most occurrences of each child kind of a node type."""
+        names = self.aliases.get(node_type, set())
+        if node_type in self.rules:
+            names = names | {node_type}
+        if not names:
+            return None
+        counts: Dict[str, int] = {}
+        for name in names:
+            for kind, count in self.count(self.rules[name]).items():
+                counts[kind] = max(counts.get(kind, 0), count)
+        return counts
+
+    def count(self, rule: Dict) -> Dict[str, int]:
+        rule_type = rule["type"]
+        counts: Dict[str, int] = {}
+        if rule_type == "SYMBOL":
+            name = rule["name"]
+            if not self._is_hidden(name):
+                counts[name] = 1
+            elif name in self.hidden:
+                counts = self.hidden[name]
+            elif name in self.expanding:
+                # A recursive hidden rule repeats whatever it contains
+                counts = {kind: MANY for kind in self._kinds(self.rules[name])}
+            else:
+                self.expanding.add(name)
+                counts = self.hidden[name] = self.count(self.rules[name])
+                self.expanding.discard(name)
+        elif rule_type == "ALIAS":
+            if rule["named"]:
+                counts[rule["value"]] = 1
+        elif rule_type == "SEQ":
+            for member in rule["members"]:
+                _add_counts(counts, self.count(member))
+        elif rule_type == "CHOICE":
+            for member in rule["members"]:
+                for kind, count in self.count(member).items():
+                    counts[kind] = max(counts.get(kind, 0), count)
+        elif rule_type in ("REPEAT", "REPEAT1"):
+            counts = {kind: MANY for kind in self.count(rule["content"])}
+        elif rule_type in ("PREC", "PREC_LEFT", "PREC_RIGHT", "PREC_DYNAMIC"):
+            counts = self.count(rule["content"])
+        # Fielded children have their own accessors, tokens have no children
+        return counts
+
+    def _kinds(self, rule: Dict, seen: Optional[Set[str]] = None) -> Set[str]:
+        """Get every child kind a rule can contain, without counting."""
+        seen = set() if seen is None else seen
+        rule_type = rule["type"]
+        if rule_type == "SYMBOL":
+            name = rule["name"]
+            if not self._is_hidden(name):
+                return {name}
+            if name in seen:
+                return set()
+            seen.add(name)
+            return self._kinds(self.rules[name], seen)
+        if rule_type == "ALIAS":
+            return {rule["value"]} if rule["named"] else set()
+        if rule_type in ("SEQ", "CHOICE"):
+            kinds: Set[str] = set()
+            for member in rule["members"]:
+                kinds |= self._kinds(member, seen)
+            return kinds
+        if rule_type in ("REPEAT", "REPEAT1") or rule_type.startswith("PREC"):
+            return self._kinds(rule["content"], seen)
+        return set()
+
+
+def _class_name(node_type: str) -> str:
+    return "".join(part.capitalize() for part in node_type.split("_"))
+
+
+def _attribute(name: str) -> str:
+    return name + "_" if keyword.iskeyword(name) else name
+
+
+def _wrapper(
+    entry: Dict, kinds: Dict[str, int], counts: Optional[Dict[str, int]]
+) -> List[str]:
+    node_type = entry["type"]
+    lines = [
+        "",
+        "",
+        f"class {_class_name(node_type)}(NodeWrapper):",
+        f'    """Typed view of a ``{node_type}`` node."""',
+        "",
+        "    __slots__ = ()",
+        f"    KIND_ID = {node_type.upper()}",
+    ]
+
+    fields = entry.get("fields", {})
+    for field in sorted(fields):
+        attribute = _attribute(field)
+        constant = "FIELD_" + field.upper()
+        if fields[field]["multiple"]:
+            lines += [
+                "",
+                "    @property",
+                f'    def {attribute}(self) -> List["Node"]:',
+                f"        return self.node.children_by_field_id({constant})",
+            ]
+        else:
+            lines += [
+                "",
+                "    @property",
+                f'    def {attribute}(self) -> Optional["Node"]:',
+                f"        return self.node.child_by_field_id({constant})",
+            ]
+
+    children = entry.get("children")
+    if children:
+        for child in sorted({t["type"] for t in children["types"] if t["named"]}):
+            attribute = _attribute(child)
+            if child in fields or child not in kinds:
+                continue
+            if counts is None or child not in counts:
+                # Not a rule of the grammar, fall back to the whole group
+                multiple = children["multiple"]
+            else:
+                multiple = counts[child] >= MANY
+            if multiple:
+                lines += [
+                    "",
+                    "    @property",
+                    f'    def {attribute}(self) -> List["Node"]:',
+                    f"        return self._children_of_kind({child.upper()})",
+                ]
+            else:
+                lines += [
+                    "",
+                    "    @property",
+                    f'    def {attribute}(self) -> Optional["Node"]:',
+                    f"        return self._child_of_kind({child.upper()})",
+                ]
+    return lines
+
+
+def render(grammar_src: str = GRAMMAR_SRC) -> str:
+    """Render the node_types module for the grammar in ``grammar_src``."""
+    with open(os.path.join(grammar_src, "node-types.json"), "r", encoding="utf-8") as f:
+        node_types = json.load(f)
+    with open(os.path.join(grammar_src, "grammar.json"), "r", encoding="utf-8") as f:
+        counter = _ChildCounter(json.load(f))
+    kinds, fields, defines = read_parser_tables(os.path.join(grammar_src, "parser.c"))
+
+    named = sorted(
+        (entry for entry in node_types if entry["named"] and entry["type"] in kinds),
+        key=lambda entry: kinds[entry["type"]],
+    )
+    used_fields = sorted(
+        {field for entry in named for field in entry.get("fields", {})},
+        key=lambda field: fields[field],
+    )
+
+    lines = [
+        "# Generated by scripts/generate_node_types.py, do not edit.",
+        '"""Kind ids, field ids and typed node wrappers of the Spthy grammar."""',
+        "",
+        "from typing import TYPE_CHECKING, Dict, List, Optional, Type",
+        "",
+        "if TYPE_CHECKING:",
+        "    from tree_sitter import Node",
+        "",
+        f"LANGUAGE_VERSION = {defines['LANGUAGE_VERSION']}",
+        f"SYMBOL_COUNT = {defines['SYMBOL_COUNT']}",
+        f"ALIAS_COUNT = {defines['ALIAS_COUNT']}",
+        f"FIELD_COUNT = {defines['FIELD_COUNT']}",
+        "",
+        "# Kind ids of named nodes, as returned by Node.kind_id",
+    ]
+    lines += [f"{entry['type'].upper()} = {kinds[entry['type']]}" for entry in named]
+    lines += ["", "# Field ids, as accepted by Node.child_by_field_id"]
+    lines += [f"FIELD_{field.upper()} = {fields[field]}" for field in used_fields]
+    lines += ["", "KIND_NAMES: Dict[int, str] = {"]
+    lines += [f'    {entry["type"].upper()}: "{entry["type"]}",' for entry in named]
+    lines += ["}", "", "FIELD_NAMES: Dict[int, str] = {"]
+    lines += [f'    FIELD_{field.upper()}: "{field}",' for field in used_fields]
+    lines += [
+        "}",
+        "",
+        "",
+        "class NodeWrapper:",
+        '    """Thin wrapper around a tree-sitter node."""',
+        "",
+        '    __slots__ = ("node",)',
+        "    KIND_ID = -1",
+        "",
+        '    def __init__(self, node: "Node"):',
+        "        self.node = node",
+        "",
+        "    def __repr__(self) -> str:",
+        '        return f"{type(self).__name__}({self.node!r})"',
+        "",
+        '    def _child_of_kind(self, kind_id: int) -> Optional["Node"]:',
+        "        for child in self.node.named_children:",
+        "            if child.kind_id == kind_id:",
+        "                return child",
+        "        return None",
+        "",
+        '    def _children_of_kind(self, kind_id: int) -> List["Node"]:',
+        "        return [c for c in self.node.named_children if c.kind_id == kind_id]",
+    ]
+    for entry in named:
+        lines += _wrapper(entry, kinds, counter.node(entry["type"]))
+    lines += ["", "", "WRAPPERS: Dict[int, Type[NodeWrapper]] = {"]
+    lines += [
+        f"    {entry['type'].upper()}: {_class_name(entry['type'])}," for entry in named
+    ]
+    lines += [
+        "}",
+        "",
+        "",
+        'def wrap(node: "Node") -> NodeWrapper:',
+        '    """Get the typed wrapper of a node."""',
+        "    return WRAPPERS.get(node.kind_id, NodeWrapper)(node)",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: List[str]) -> int:
+    content = render()
+    if "--check" in argv:
+        with open(OUTPUT, "r", encoding="utf-8") as f:
+            if f.read() != content:
+                print(f"{OUTPUT} is out of date", file=sys.stderr)
+                return 1
+        return 0
+    with open(OUTPUT, "w", encoding="utf-8", newline="\n") as f:
+        f.write(content)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
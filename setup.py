@@ -1,8 +1,10 @@
 from setuptools import setup, Extension, find_packages
 from setuptools.command.build_py import build_py
 import os
+import sys
 import glob
 import shutil
+import subprocess
 
 
 def get_tree_sitter_sources():
@@ -26,10 +28,19 @@ tree_sitter_ext = Extension(
     define_macros=[('TREE_SITTER_HIDE_SYMBOLS', None)],
 )
 
+def generate_node_types():
+    """Regenerate node_types.py from the grammar sources"""
+    if os.path.exists("grammars/tree-sitter-spthy/src/parser.c"):
+        subprocess.check_call([sys.executable, "scripts/generate_node_types.py"])
+
+
 class CustomBuildPy(build_py):
     """Custom build_py command to ensure all package files are copied"""
 
     def run(self):
+        # Keep the kind/field id tables in sync with the compiled grammar
+        generate_node_types()
+
         # Run the standard build_py
         super().run()
 
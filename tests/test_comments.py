@@ -0,0 +1,163 @@
+"""
+Tests for comment scanning in the external scanner.
+"""
+
+import glob
+import os
+import random
+import re
+
+import pytest
+
+import tree_sitter_spthy as ts_spthy
+from tree_sitter import Parser
+
+CORPUS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "grammars",
+    "tree-sitter-spthy",
+    "test",
+    "corpus",
+)
+
+_HEADER = re.compile(r"^={3,}\n(.*?)\n={3,}\n", re.M)
+_DIVIDER = re.compile(r"^-{3,}\n", re.M)
+
+
+def read_corpus():
+    """Read the tree-sitter corpus files as (title, source, tree) tuples."""
+    cases = []
+    for path in sorted(glob.glob(os.path.join(CORPUS_DIR, "*.txt"))):
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        parts = _HEADER.split(content)[1:]
+        for title, body in zip(parts[::2], parts[1::2]):
+            source, expected = _DIVIDER.split(body, 1)
+            cases.append((title, source.strip("\n"), " ".join(expected.split())))
+    return cases
+
+
+@pytest.fixture
+def parser():
+    """Fixture to create a Parser for the Spthy language."""
+    return Parser(ts_spthy.language())
+
+
+def comment_spans(tree):
+    """Get (type, start_byte, end_byte) of every comment in a tree."""
+    spans = []
+    stack = [tree.root_node]
+    while stack:
+        node = stack.pop()
+        if node.type in ("multi_comment", "single_comment"):
+            spans.append((node.type, node.start_byte, node.end_byte))
+        stack.extend(node.children)
+    return sorted(spans, key=lambda span: span[1])
+
+
+@pytest.mark.parametrize(
+    "title, source, expected", read_corpus(), ids=lambda value: str(value)[:40]
+)
+def test_corpus(parser, title, source, expected):
+    """Test that the comment corpus parses to the recorded trees."""
+    tree = parser.parse(source.encode("utf-8"))
+    assert str(tree.root_node) == expected
+
+
+def test_nul_byte_does_not_end_comments(parser):
+    """Test that a NUL byte is comment text, not the end of the input."""
+    source = b"theory T begin\n// a\x00b\n/* c\x00d */\nrule R: [ ] --> [ ]\nend\n"
+    tree = parser.parse(source)
+
+    assert not tree.root_node.has_error
+    assert comment_spans(tree) == [
+        ("single_comment", 15, 21),
+        ("multi_comment", 22, 31),
+    ]
+
+
+def test_unterminated_comment_is_an_error(parser):
+    """Test that an unterminated comment stops at the end of the input."""
+    source = b"theory T begin\nrule R: [ ] --> [ ]\n/* never /* closed */\nend\n"
+    tree = parser.parse(source)
+
+    opener = source.index(b"/*")
+    assert tree.root_node.has_error
+    assert all(start != opener for _, start, _ in comment_spans(tree))
+
+
+def test_line_comment_at_end_of_input(parser):
+    """Test that a line comment may end the input without a newline."""
+    source = b"theory T begin\nrule R: [ ] --> [ ]\nend\n// a\x00"
+    tree = parser.parse(source)
+
+    assert not tree.root_node.has_error
+    assert comment_spans(tree) == [("single_comment", 39, len(source))]
+
+
+THEORY_TOKENS = (
+    "theory T begin rule R : [ Fr ( ~k ) ] --> [ Out ( ~k ) ] "
+    'lemma L : " All k #i . Out ( k ) @ #i " end'
+).split()
+
+COMMENT_ALPHABET = ["a", " ", "*", "/", "\n", "\t", "∀", "😀", "\x00", "{", "}"]
+
+
+def multi_comment_end(text: str, i: int):
+    """Reference end of a nested comment whose "/*" ends before ``i``."""
+    depth = 1
+    while i < len(text):
+        if text[i] == "*":
+            while i < len(text) and text[i] == "*":
+                i += 1
+            if i < len(text) and text[i] == "/":
+                i += 1
+                depth -= 1
+                if depth == 0:
+                    return i
+        elif text[i] == "/":
+            i += 1
+            if i < len(text) and text[i] == "*":
+                i += 1
+                depth += 1
+        else:
+            i += 1
+    return None
+
+
+def random_comment(rng: random.Random) -> str:
+    """Generate a random comment, including NUL bytes and nested comments."""
+    if rng.random() < 0.4:
+        body = "".join(rng.choice(COMMENT_ALPHABET) for _ in range(rng.randrange(20)))
+        return "//" + body.replace("\n", " ") + "\n"
+    while True:
+        body = "".join(rng.choice(COMMENT_ALPHABET) for _ in range(rng.randrange(40)))
+        comment = "/*" + body + "*/"
+        if multi_comment_end(comment, 2) == len(comment):
+            return comment
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_fuzzed_comments(parser, seed):
+    """Test that randomly placed comments are scanned exactly."""
+    rng = random.Random(seed)
+    parts, expected = [], []
+    offset = 0
+    for token in THEORY_TOKENS:
+        parts.append(token)
+        offset += len(token.encode("utf-8"))
+        parts.append(" ")
+        offset += 1
+        for _ in range(rng.choice([0, 0, 1, 2])):
+            comment = random_comment(rng)
+            size = len(comment.encode("utf-8"))
+            kind = "single_comment" if comment.startswith("//") else "multi_comment"
+            # The newline ending a line comment is not part of the token
+            end = offset + size - (kind == "single_comment")
+            expected.append((kind, offset, end))
+            parts.append(comment + rng.choice([" ", "\n", "\t"]))
+            offset += size + 1
+
+    tree = parser.parse("".join(parts).encode("utf-8"))
+    assert not tree.root_node.has_error
+    assert comment_spans(tree) == expected
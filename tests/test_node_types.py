@@ -0,0 +1,113 @@
+"""
+Tests that the generated node_types module matches the compiled grammar.
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+import tree_sitter_spthy as ts_spthy
+from tree_sitter import Parser
+
+from py_tree_sitter_spthy import node_types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def language():
+    """Fixture to get the compiled Spthy language."""
+    return ts_spthy.language()
+
+
+@pytest.fixture
+def generator():
+    """Fixture to load scripts/generate_node_types.py."""
+    path = os.path.join(ROOT, "scripts", "generate_node_types.py")
+    spec = importlib.util.spec_from_file_location("generate_node_types", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_module_is_up_to_date(generator):
+    """Test that node_types.py was regenerated after the last grammar change."""
+    with open(generator.OUTPUT, "r", encoding="utf-8") as f:
+        assert f.read() == generator.render(), (
+            "py_tree_sitter_spthy/node_types.py is out of date, "
+            "run python scripts/generate_node_types.py"
+        )
+
+
+def test_kind_ids_match_language(language):
+    """Test that every kind constant matches the compiled parser."""
+    assert language.abi_version == node_types.LANGUAGE_VERSION
+    for kind_id, name in node_types.KIND_NAMES.items():
+        assert language.id_for_node_kind(name, True) == kind_id, name
+        assert language.node_kind_for_id(kind_id) == name
+
+
+def test_field_ids_match_language(language):
+    """Test that every field constant matches the compiled parser."""
+    assert language.field_count == node_types.FIELD_COUNT
+    for field_id, name in node_types.FIELD_NAMES.items():
+        assert language.field_id_for_name(name) == field_id, name
+
+
+def test_parsed_nodes_have_known_kinds(language):
+    """Test that every named node of a real theory has a kind constant."""
+    test_file = os.path.join(os.path.dirname(__file__), "SimpleChallengeResponse.spthy")
+    with open(test_file, "rb") as f:
+        tree = Parser(language).parse(f.read())
+
+    stack = [tree.root_node]
+    while stack:
+        node = stack.pop()
+        if node.is_named and not node.is_error:
+            assert node_types.KIND_NAMES[node.kind_id] == node.type
+        stack.extend(node.children)
+
+
+def test_wrappers_resolve_fields(language):
+    """Test that the typed wrappers return the same children as field names."""
+    source = b"""theory T begin
+rule R: [ Fr(~k) ] --[ Start(~k) ]-> [ Out(~k) ]
+lemma L: "All k #i. Start(k) @ #i ==> F"
+end
+"""
+    tree = Parser(language).parse(source)
+    theory = node_types.wrap(tree.root_node)
+    assert isinstance(theory, node_types.Theory)
+    assert theory.theory_name.text == b"T"
+
+    lemma = node_types.wrap(theory.lemma[0])
+    assert isinstance(lemma, node_types.Lemma)
+    assert lemma.formula == lemma.node.child_by_field_name("formula")
+    assert lemma.lemma_identifier.text == b"L"
+
+    rule = node_types.wrap(theory.rule[0])
+    simple_rule = node_types.wrap(rule.simple_rule)
+    assert simple_rule.premise.text == b"[ Fr(~k) ]"
+    assert simple_rule.conclusion.text == b"[ Out(~k) ]"
+    assert simple_rule.rule_let_block is None
+
+
+def test_child_cardinality(language):
+    """Test that only children that can repeat are returned as lists."""
+    source = b"""theory T begin
+rule R: [ Fr(~k), !Key(~k), In(x) ] --> [ Out(~k) ]
+end
+"""
+    tree = Parser(language).parse(source)
+    theory = node_types.Theory(tree.root_node)
+    assert len(theory.rule) == 1
+
+    rule = node_types.Rule(theory.rule[0])
+    assert rule.variants is None
+    premise = node_types.Premise(node_types.SimpleRule(rule.simple_rule).premise)
+    assert [fact.text for fact in premise.linear_fact] == [b"Fr(~k)", b"In(x)"]
+
+    fact = node_types.LinearFact(premise.linear_fact[0])
+    assert fact.arguments.text == b"~k"
+    assert fact.fact_annotes is None
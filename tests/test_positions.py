@@ -0,0 +1,111 @@
+"""
+Tests for the byte/point/UTF-16/code point position index.
+"""
+
+import pytest
+
+import tree_sitter_spthy as ts_spthy
+from tree_sitter import Parser
+
+from py_tree_sitter_spthy import PositionIndex
+
+SOURCE = """theory Unicode begin
+// ∀ quantifiers and emoji 😀 in comments
+rule R: [ Fr(~k) ] --[ Start(~k) ]-> [ Out(~k) ]
+lemma L: "∀ k #i. Start(k) @ #i ⇒ ∃ #j. K(k) @ #j"
+end
+""".encode()
+
+
+def reference_positions(source: bytes):
+    """Compute every position of a document by rescanning it."""
+    positions = []
+    byte = row = column = utf16 = 0
+    for char_offset, char in enumerate(source.decode("utf-8")):
+        positions.append((byte, (row, column), (row, utf16), char_offset))
+        size = len(char.encode("utf-8"))
+        byte += size
+        if char == "\n":
+            row, column, utf16 = row + 1, 0, 0
+        else:
+            column += size
+            utf16 += len(char.encode("utf-16-le")) // 2
+    positions.append((byte, (row, column), (row, utf16), len(source.decode())))
+    return positions
+
+
+def assert_matches_reference(index: PositionIndex):
+    for byte, point, utf16, char_offset in reference_positions(index.source):
+        assert index.byte_to_point(byte) == point
+        assert index.point_to_byte(point) == byte
+        assert index.byte_to_utf16(byte) == utf16
+        assert index.utf16_to_byte(utf16) == byte
+        assert index.point_to_utf16(point) == utf16
+        assert index.utf16_to_point(utf16) == point
+        assert index.byte_to_char(byte) == char_offset
+        assert index.char_to_byte(char_offset) == byte
+
+
+def test_conversions_match_rescan():
+    """Test all conversions against a naive rescan of the document."""
+    index = PositionIndex(SOURCE)
+    assert index.line_count == SOURCE.count(b"\n") + 1
+    assert index.char_count == len(SOURCE.decode())
+    assert_matches_reference(index)
+
+
+def test_offsets_inside_a_character_snap_to_its_start():
+    """Test that offsets in the middle of a character round down."""
+    index = PositionIndex("a😀b".encode())
+    for byte in range(1, 5):
+        assert index.byte_to_utf16(byte) == (0, 1)
+        assert index.byte_to_char(byte) == 1
+    assert index.utf16_to_byte((0, 2)) == 1
+    assert index.utf16_to_byte((0, 3)) == 5
+
+
+def test_positions_are_clamped():
+    """Test that out of range positions are clamped to the document."""
+    index = PositionIndex(b"ab\ncd")
+    assert index.point_to_byte((0, 10)) == 2
+    assert index.utf16_to_byte((5, 0)) == 3
+    assert index.byte_to_point(100) == (1, 2)
+    assert index.char_to_byte(-1) == 0
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ("~k", "~ltk😀"),
+        ("∀ k #i. Start(k) @ #i ⇒ ", ""),
+        ("\nlemma", "\n// ∃\n\nlemma"),
+        ("end\n", ""),
+    ],
+)
+def test_edit_updates_index(old, new):
+    """Test that an edited index equals one built from the new source."""
+    index = PositionIndex(SOURCE)
+    start = SOURCE.index(old.encode())
+    index.edit(start, start + len(old.encode()), new.encode())
+
+    expected = SOURCE.replace(old.encode(), new.encode(), 1)
+    assert index.source == expected
+    assert_matches_reference(index)
+
+
+def test_edit_drives_tree_edit():
+    """Test that the edit arguments keep an incremental parse consistent."""
+    parser = Parser(ts_spthy.language())
+    index = PositionIndex(SOURCE)
+    tree = parser.parse(index.source)
+
+    start = SOURCE.index("∀ quantifiers".encode())
+    tree.edit(**index.edit(start, start + len("∀".encode()), "∀∃ 😀".encode()))
+    tree = parser.parse(index.source, tree)
+
+    lemma = next(n for n in tree.root_node.children if n.type == "lemma")
+    fresh = parser.parse(index.source)
+    fresh_lemma = next(n for n in fresh.root_node.children if n.type == "lemma")
+    assert lemma.start_point == fresh_lemma.start_point
+    assert index.byte_to_point(lemma.start_byte) == tuple(lemma.start_point)
+    assert index.node_utf16_range(lemma) == ((3, 0), (3, 50))
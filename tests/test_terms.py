@@ -0,0 +1,205 @@
+"""
+Tests for the hash-consed term DAG of py_tree_sitter_spthy.
+"""
+
+import os
+
+import pytest
+
+import tree_sitter_spthy as ts_spthy
+from tree_sitter import Parser
+
+from py_tree_sitter_spthy import TermDAG, extract_term_dag
+
+
+@pytest.fixture
+def parser():
+    """Fixture to create a Parser for the Spthy language."""
+    return Parser(ts_spthy.language())
+
+
+@pytest.fixture
+def spthy_source():
+    """Fixture to read the SimpleChallengeResponse.spthy file."""
+    test_file = os.path.join(os.path.dirname(__file__), "SimpleChallengeResponse.spthy")
+    with open(test_file, "rb") as f:
+        return f.read()
+
+
+def parse_dag(parser, source: bytes) -> TermDAG:
+    return extract_term_dag(parser.parse(source))
+
+
+def test_identical_terms_share_an_id(parser, spthy_source):
+    """Test that repeated terms are stored once with one span per occurrence."""
+    dag = parse_dag(parser, spthy_source)
+
+    pk = dag.lookup("app", "pk", (dag.lookup("fresh_var", "ltk"),))
+    assert pk is not None
+    assert dag.format(pk) == "pk(~ltk)"
+    spans = dag.occurrences(pk)
+    assert len(spans) == 2
+    for start, end in spans:
+        assert spthy_source[start:end] == b"pk(~ltk)"
+
+
+def test_terms_are_distinct(parser, spthy_source):
+    """Test that the DAG holds no two structurally equal terms."""
+    dag = parse_dag(parser, spthy_source)
+
+    keys = [(t.kind, t.label, t.args) for t in dag.terms]
+    assert len(keys) == len(set(keys)) == len(dag)
+    for term in dag.terms:
+        assert all(arg < term.id for arg in term.args)
+
+
+def test_syntactic_sugar_is_normalized(parser):
+    """Test that whitespace, parentheses and f{x}y sugar do not split terms."""
+    source = b"""theory T begin
+rule R:
+  [ In(aenc{'1', ~k}pk( x )), In(aenc(<'1', ~k>, pk(x))), In(((x))) ]
+  -->
+  [ Out(x) ]
+lemma L: "All x #i. Out(x) @ i ==> Ex #j. In(x) @ #j"
+end
+"""
+    dag = parse_dag(parser, source)
+
+    aenc = [t for t in dag.terms if t.label == "aenc"]
+    assert len(aenc) == 1
+    assert len(dag.occurrences(aenc[0].id)) == 2
+    assert dag.format(aenc[0].id) == "aenc(<'1', ~k>, pk(x))"
+
+    x = dag.lookup("msg_var_or_nullary_fun", "x")
+    assert len(dag.occurrences(x)) == 7
+
+    i = dag.lookup("temporal_var", "i")
+    assert len(dag.occurrences(i)) == 2
+
+
+def test_sorts_do_not_split_variables(parser):
+    """Test that a variable is the same whether its sort is a prefix or a suffix."""
+    source = b"""theory T begin
+rule R: [ In(<x, x:msg, $A, A:pub, ~k, k:fresh, %n, n:nat, x.1>) ] --> [ ]
+lemma L: "All #i j:node. R() @ i & R() @ j ==> #i < j:node"
+end
+"""
+    dag = parse_dag(parser, source)
+
+    for kind, label, count in [
+        ("msg_var_or_nullary_fun", "x", 2),
+        ("pub_var", "A", 2),
+        ("fresh_var", "k", 2),
+        ("nat_var", "n", 2),
+        ("msg_var_or_nullary_fun", "x.1", 1),
+        ("temporal_var", "i", 3),
+        ("temporal_var", "j", 3),
+    ]:
+        term_id = dag.lookup(kind, label)
+        assert term_id is not None, (kind, label)
+        assert len(dag.occurrences(term_id)) == count, (kind, label)
+
+    assert dag.format(dag.lookup("pub_var", "A")) == "$A"
+    assert dag.format(dag.lookup("fresh_var", "k")) == "~k"
+
+
+def test_tuples_are_right_nested_pairs(parser):
+    """Test that <a, b, c>, <a, <b, c>> and f{a, b, c}k share their pairs."""
+    source = b"""theory T begin
+rule R: [ In(<a, b, c>), In(<a, <b, c>>), In(f{a, b, c}k) ] --> [ ]
+end
+"""
+    dag = parse_dag(parser, source)
+
+    a, b, c = (dag.lookup("msg_var_or_nullary_fun", n) for n in "abc")
+    bc = dag.lookup("tuple", "", (b, c))
+    abc = dag.lookup("tuple", "", (a, bc))
+    assert abc is not None
+    assert len(dag.occurrences(abc)) == 3
+    assert len(dag.occurrences(bc)) == 3
+    assert dag.format(abc) == "<a, b, c>"
+    assert [t for t in dag.terms if t.kind == "tuple"] == [dag[bc], dag[abc]]
+
+
+def test_exponentiation_is_binary(parser):
+    """Test that ^ is a binary, right associative operator."""
+    source = b"""theory T begin
+rule R: [ In(g^a^b), In(g^(a^b)), In((g^a)^b) ] --> [ ]
+end
+"""
+    dag = parse_dag(parser, source)
+
+    g, a, b = (dag.lookup("msg_var_or_nullary_fun", n) for n in "gab")
+    right = dag.lookup("exp", "", (g, dag.lookup("exp", "", (a, b))))
+    left = dag.lookup("exp", "", (dag.lookup("exp", "", (g, a)), b))
+    assert len(dag.occurrences(right)) == 2
+    assert len(dag.occurrences(left)) == 1
+    assert all(len(t.args) == 2 for t in dag.terms if t.kind == "exp")
+
+
+def test_associative_operators_are_flattened(parser):
+    """Test that nested XOR terms are flattened, keeping the operand order."""
+    source = b"""theory T begin
+rule R: [ In(a XOR b XOR c), In((a XOR b) XOR c), In(a XOR (b XOR c)) ] --> [ ]
+rule S: [ In(b XOR a) ] --> [ ]
+end
+"""
+    dag = parse_dag(parser, source)
+
+    a, b, c = (dag.lookup("msg_var_or_nullary_fun", n) for n in "abc")
+    abc = dag.lookup("xor", "", (a, b, c))
+    assert len(dag.occurrences(abc)) == 3
+    assert dag.format(abc) == "(a XOR b XOR c)"
+    # Commutativity is not normalized
+    assert dag.lookup("xor", "", (b, a)) not in (None, dag.lookup("xor", "", (a, b)))
+
+
+def test_quoted_names_keep_their_whitespace(parser):
+    """Test that names differing only in whitespace are different terms."""
+    source = b"""theory T begin
+rule R: [ In('hello world'), In('helloworld'), In(~'n 1'), In(~'n1') ] --> [ ]
+end
+"""
+    dag = parse_dag(parser, source)
+
+    assert dag.lookup("pub_name", "'hello world'") is not None
+    assert dag.lookup("pub_name", "'helloworld'") is not None
+    assert dag.lookup("fresh_name", "~'n 1'") is not None
+    assert dag.lookup("fresh_name", "~'n1'") is not None
+    assert all(len(dag.occurrences(t.id)) == 1 for t in dag.terms if "'" in t.label)
+
+
+def test_deep_terms(parser):
+    """Test that deeply nested terms do not hit the recursion limit."""
+    depth = 1000
+    source = (
+        "theory T begin\nrule R: [ In("
+        + "h(" * depth
+        + "x"
+        + ")" * depth
+        + "), In(<"
+        + ", ".join(f"a{i}" for i in range(depth))
+        + ">), In(g"
+        + "".join(f"^e{i}" for i in range(depth))
+        + ") ] --> [ ]\nend\n"
+    ).encode("utf-8")
+    tree = parser.parse(source)
+    assert not tree.root_node.has_error
+    dag = extract_term_dag(tree)
+
+    nested = max((t for t in dag.terms if t.label == "h"), key=lambda t: t.id)
+    assert dag.format(nested.id) == "h(" * depth + "x" + ")" * depth
+    assert sum(1 for t in dag.terms if t.kind == "tuple") == depth - 1
+    assert sum(1 for t in dag.terms if t.kind == "exp") == depth
+    assert dag.format(len(dag) - 1).startswith("(g ^ (e0 ^ (e1 ^")
+
+
+def test_add_tree_accumulates(parser, spthy_source):
+    """Test that several trees can share a single DAG."""
+    dag = TermDAG()
+    first = dag.add_tree(parser.parse(spthy_source))
+    size = len(dag)
+    second = dag.add_tree(parser.parse(spthy_source))
+
+    assert first == second
+    assert len(dag) == size
@@ -0,0 +1,123 @@
+"""
+Tests for free-threading and subinterpreter support of the _binding module.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+import sysconfig
+
+import pytest
+
+try:
+    import _interpreters
+except ImportError:
+    try:
+        import _xxsubinterpreters as _interpreters
+    except ImportError:
+        _interpreters = None
+
+FREE_THREADED = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+TEST_FILE = os.path.join(os.path.dirname(__file__), "SimpleChallengeResponse.spthy")
+
+
+@pytest.mark.skipif(_interpreters is None, reason="requires subinterpreters")
+def test_binding_loads_in_isolated_subinterpreter():
+    """Test that _binding can be imported by an interpreter with its own GIL."""
+    path = importlib.util.find_spec("tree_sitter_spthy._binding").origin
+    code = f"""
+import importlib.util
+spec = importlib.util.spec_from_file_location("tree_sitter_spthy._binding", {path!r})
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+assert module.language() is not None
+"""
+    interpreter = _interpreters.create()
+    try:
+        # Python 3.12 raises on failure, 3.13+ returns the exception info
+        error = _interpreters.run_string(interpreter, code)
+        assert error is None, error.formatted
+    finally:
+        _interpreters.destroy(interpreter)
+
+
+@pytest.mark.skipif(not FREE_THREADED, reason="requires a free-threaded build")
+def test_import_keeps_gil_disabled():
+    """Test that importing the binding does not re-enable the GIL."""
+    path = importlib.util.find_spec("tree_sitter_spthy._binding").origin
+    # Load only the extension, tree_sitter itself may still need the GIL
+    code = f"""
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location("tree_sitter_spthy._binding", {path!r})
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+sys.exit(sys._is_gil_enabled())
+"""
+    result = subprocess.run(
+        [sys.executable, "-W", "error", "-c", code], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+# Script timing the parses on one thread, then on THREADS threads. Its last
+# output line is "<seconds for one thread> <seconds for THREADS threads>".
+SCALING_SCRIPT = """
+import sys, time
+from concurrent.futures import ThreadPoolExecutor
+
+import tree_sitter_spthy as ts_spthy
+from tree_sitter import Parser
+
+if sys._is_gil_enabled():
+    sys.exit("the GIL was re-enabled while importing tree_sitter")
+
+threads, parses, repeat = {threads}, {parses}, {repeat}
+with open({path!r}, "rb") as f:
+    source = f.read() * 20
+language = ts_spthy.language()
+expected = str(Parser(language).parse(source).root_node)
+
+def work(_):
+    parser = Parser(language)
+    for _ in range(parses):
+        tree = parser.parse(source)
+    return str(tree.root_node)
+
+def best(count):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        assert list(executor.map(work, range(count))) == [expected] * count
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+with ThreadPoolExecutor(threads) as executor:
+    # Warm up the pool
+    list(executor.map(work, range(threads)))
+    print(best(1), best(threads))
+"""
+
+
+@pytest.mark.skipif(not FREE_THREADED, reason="requires a free-threaded build")
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="requires several CPUs")
+def test_parallel_parsing_scales():
+    """Test that parsing on N threads is faster than N parses on one thread."""
+    threads = min(4, os.cpu_count())
+    code = SCALING_SCRIPT.format(threads=threads, parses=20, repeat=5, path=TEST_FILE)
+    # Measure in a fresh interpreter with the default GIL setting, so that the
+    # script fails if importing tree_sitter and the binding turns it back on.
+    env = {key: value for key, value in os.environ.items() if key != "PYTHON_GIL"}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env
+    )
+    assert result.returncode == 0, result.stderr
+    single, parallel = map(float, result.stdout.split()[-2:])
+
+    # Linear scaling would be a speedup of ``threads``, a serialized run one.
+    # Shared CI runners are noisy, so only ask for half the ideal speedup.
+    speedup = threads * single / parallel
+    assert speedup >= max(1.3, threads / 2), (
+        f"{threads} threads gave a {speedup:.2f}x speedup "
+        f"({parallel:.3f}s vs {single:.3f}s for one thread)"
+    )
@@ -0,0 +1,265 @@
+"""
+Tests for the single-walk validation engine of py_tree_sitter_spthy.
+"""
+
+import os
+
+import pytest
+
+import tree_sitter_spthy as ts_spthy
+from tree_sitter import Parser
+
+from py_tree_sitter_spthy import Check, Validator, node_types, validate
+from py_tree_sitter_spthy.validation import (
+    DEFAULT_CHECKS,
+    ERROR,
+    DuplicateNames,
+    EmittedActions,
+    UndeclaredFunctions,
+    UnemittedLemmaActions,
+    UnusedRestrictions,
+)
+
+THEORY = b"""theory Bad begin
+builtins: hashing
+functions: f/2, g(bitstring, bitstring): bitstring
+macros: m(x) = h(x)
+rule Setup: [ Fr(~k) ] --[ Setup(~k) ]-> [ !Key(~k), St(~k) ]
+rule Use:
+    [ St(k), Missing(k), !Key(k) ]
+  --[ Used(k) ]->
+    [ Out(f(k, k)), Out(g(k)), Out(unknown(k)), Out(m(k)), Out(h(k, k)) ]
+rule Setup: [ ] --> [ ]
+#ifdef A
+rule Cond: [ ] --> [ ]
+#else
+rule Cond: [ ] --> [ ]
+#endif
+restriction Eq: "All x y #i. Eq(x, y) @ #i ==> x = y"
+restriction Once: "All #i #j. Setup(x) @ #i & Setup(y) @ #j ==> #i = #j"
+lemma Sec: "All k #i. Used(k) @ #i ==> not (Ex #j. K(k) @ #j) & (Ex #l. Leak(k) @ #l)"
+lemma Sec: exists-trace "Ex k #i. Setup(k) @ #i"
+end
+"""
+
+SAPIC_THEORY = b"""theory Sapic begin
+builtins: symmetric-encryption
+let Send(k, m) = out(senc(m, k)); event Sent(m); 0
+let Receive(k) = in(c); let m = sdec(c, k) in event Received(m); 0
+process: new k; new m; (Send(k, m) | !Receive(k) | Receive(k, m))
+lemma Executable: exists-trace "Ex m #i #j. Sent(m) @ #i & Received(m) @ #j"
+end
+"""
+
+
+@pytest.fixture
+def parser():
+    """Fixture to create a Parser for the Spthy language."""
+    return Parser(ts_spthy.language())
+
+
+@pytest.fixture
+def spthy_source():
+    """Fixture to read the SimpleChallengeResponse.spthy file."""
+    test_file = os.path.join(os.path.dirname(__file__), "SimpleChallengeResponse.spthy")
+    with open(test_file, "rb") as f:
+        return f.read()
+
+
+def messages(findings, check):
+    return [finding.message for finding in findings if finding.check == check]
+
+
+def test_clean_theory_has_no_findings(parser, spthy_source):
+    """Test that a well-formed theory passes all default checks."""
+    assert validate(parser.parse(spthy_source)) == []
+
+
+def test_undeclared_functions(parser):
+    """Test that unknown functions and arity mismatches are errors."""
+    findings = validate(parser.parse(THEORY))
+
+    assert messages(findings, "undeclared-function") == [
+        "Function g applied to 1 arguments but declared with arity 2",
+        "Undeclared function unknown/1",
+        "Function h applied to 2 arguments but declared with arity 1",
+    ]
+    assert all(
+        finding.severity == ERROR
+        for finding in findings
+        if finding.check == "undeclared-function"
+    )
+
+
+def test_sapic_processes_are_declarations(parser):
+    """Test that let-bound processes and their calls are not function uses."""
+    tree = parser.parse(SAPIC_THEORY)
+    assert not tree.root_node.has_error
+
+    assert messages(validate(tree), "undeclared-function") == [
+        "Process Receive applied to 2 arguments but declared with arity 1"
+    ]
+
+
+def test_half_typed_declaration(parser):
+    """Test that a declaration without its arity does not crash validation."""
+    source = b"""theory T begin
+functions: f/
+rule R: [ In(f(x)) ] --> [ Out(g(x)) ]
+end
+"""
+    tree = parser.parse(source)
+    assert tree.root_node.has_error
+
+    assert messages(validate(tree), "undeclared-function") == [
+        "Undeclared function g/1"
+    ]
+
+
+def test_unproduced_facts(parser):
+    """Test that consumed facts no rule produces are reported."""
+    findings = validate(parser.parse(THEORY))
+
+    assert messages(findings, "unproduced-fact") == [
+        "Fact Missing/1 is consumed but never produced"
+    ]
+
+
+def test_lemma_and_restriction_actions(parser):
+    """Test that actions no rule emits are reported in lemmas and restrictions."""
+    findings = validate(parser.parse(THEORY))
+
+    assert messages(findings, "unemitted-action") == [
+        "Lemma Sec refers to action Leak/1 which no rule emits"
+    ]
+    assert messages(findings, "unused-restriction") == [
+        "Restriction Eq only refers to actions no rule emits"
+    ]
+
+
+def test_duplicate_names(parser):
+    """Test that duplicates are reported, but not across #ifdef branches."""
+    findings = validate(parser.parse(THEORY))
+
+    assert messages(findings, "duplicate-name") == [
+        "Duplicate rule name Setup, first defined on line 5",
+        "Duplicate lemma name Sec, first defined on line 18",
+    ]
+    duplicate = next(f for f in findings if f.check == "duplicate-name")
+    assert duplicate.start_point == (9, 5)
+    assert THEORY[duplicate.start_byte : duplicate.end_byte] == b"Setup"
+
+
+def test_findings_are_in_source_order(parser):
+    """Test that findings of all checks are merged by position."""
+    findings = validate(parser.parse(THEORY))
+
+    assert len(findings) == 8
+    assert [f.start_byte for f in findings] == sorted(f.start_byte for f in findings)
+
+
+def test_checks_can_be_selected(parser):
+    """Test that a validator only runs the checks it was given."""
+    findings = Validator([DuplicateNames]).validate(parser.parse(THEORY))
+
+    assert {finding.check for finding in findings} == {"duplicate-name"}
+    assert Validator().checks == list(DEFAULT_CHECKS)
+
+
+def test_register_custom_check(parser, spthy_source):
+    """Test that a registered check is called for the kinds it visits."""
+    validator = Validator([UndeclaredFunctions])
+
+    @validator.register
+    class LemmaCount(Check):
+        name = "lemma-count"
+
+        def __init__(self):
+            self.lemmas = []
+
+        def visit_lemma(self, node, context):
+            assert node.kind_id == node_types.LEMMA
+            self.lemmas.append(node)
+
+        def finish(self, context):
+            context.report(self, self.lemmas[-1], f"{len(self.lemmas)} lemmas")
+
+    findings = validator.validate(parser.parse(spthy_source))
+
+    assert [finding.message for finding in findings] == ["3 lemmas"]
+    assert findings[0].check == "lemma-count"
+
+
+def test_required_checks_are_shared(parser, monkeypatch):
+    """Test that a required check runs once however many checks require it."""
+    created = []
+    init = EmittedActions.__init__
+
+    def counting_init(self):
+        init(self)
+        created.append(self)
+
+    monkeypatch.setattr(EmittedActions, "__init__", counting_init)
+    validator = Validator([UnemittedLemmaActions, UnusedRestrictions])
+    findings = validator.validate(parser.parse(THEORY))
+
+    assert len(created) == 1
+    assert {finding.check for finding in findings} == {
+        "unemitted-action",
+        "unused-restriction",
+    }
+
+
+@pytest.mark.parametrize(
+    "checks",
+    [
+        [EmittedActions, UnemittedLemmaActions, UnusedRestrictions],
+        [UnemittedLemmaActions, EmittedActions, UnusedRestrictions],
+    ],
+)
+def test_listed_required_check_is_shared(parser, monkeypatch, checks):
+    """Test that a required check also listed explicitly runs only once."""
+    created = []
+    init = EmittedActions.__init__
+
+    def counting_init(self):
+        init(self)
+        created.append(self)
+
+    monkeypatch.setattr(EmittedActions, "__init__", counting_init)
+    findings = Validator(checks).validate(parser.parse(THEORY))
+
+    assert len(created) == 1
+    assert len(findings) == 2
+
+
+def test_unknown_kind_is_rejected():
+    """Test that visiting a node kind the grammar does not have is an error."""
+    with pytest.raises(ValueError, match="visit_lemmas"):
+
+        class Typo(Check):
+            def visit_lemmas(self, node, context):
+                pass
+
+
+def test_tree_is_walked_once(parser, spthy_source):
+    """Test that every node is visited exactly once whatever the check count."""
+    tree = parser.parse(spthy_source)
+    expected = []
+    stack = [tree.root_node]
+    while stack:
+        node = stack.pop()
+        if node.kind_id == node_types.IDENT:
+            expected.append(node.start_byte)
+        stack.extend(node.children)
+
+    seen = []
+
+    class Idents(Check):
+        def visit_ident(self, node, context):
+            seen.append(node.start_byte)
+
+    Validator([Idents, *DEFAULT_CHECKS, Idents]).validate(tree)
+
+    assert sorted(seen) == sorted(expected * 2)
+    assert seen[::2] == seen[1::2]